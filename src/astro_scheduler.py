@@ -10,18 +10,137 @@ Features:
 - Triggers video export after session completes
 """
 
+import collections
+import concurrent.futures
+import functools
+import heapq
+import itertools
 import threading
 import time
-from datetime import datetime, date, timedelta
+from dataclasses import dataclass
+from datetime import datetime, date, timedelta, time as dtime
 from typing import Optional, Callable
 from pathlib import Path
 
-try:
-    from src.twilight_calculator import TwilightCalculator, DarknessWindow
-    from src.config_manager import ConfigManager
-except ImportError:
-    from twilight_calculator import TwilightCalculator, DarknessWindow
-    from config_manager import ConfigManager
+from twilight_calculator import TwilightCalculator, DarknessWindow
+from config_manager import ConfigManager
+
+
+@functools.lru_cache(maxsize=8)
+def _get_calculator(lat_q: float, lon_q: float) -> TwilightCalculator:
+    """Shared TwilightCalculator per (quantized) location."""
+    return TwilightCalculator(lat_q, lon_q)
+
+
+@functools.lru_cache(maxsize=64)
+def _compute_window(
+    date_ordinal: int,
+    lat_q: float,
+    lon_q: float,
+    twilight_type: str,
+    start_offset_minutes: int,
+    end_offset_minutes: int
+) -> Optional[DarknessWindow]:
+    """Darkness window for an evening date - a pure function of its inputs, so memoized.
+
+    lat/lon are quantized to 4 decimals (~11 m) by the caller, far finer than
+    twilight times can resolve, so nearby edits of the same spot share entries.
+    """
+    return _get_calculator(lat_q, lon_q).get_darkness_window(
+        date.fromordinal(date_ordinal),
+        twilight_type=twilight_type,
+        start_offset_minutes=start_offset_minutes,
+        end_offset_minutes=end_offset_minutes
+    )
+
+
+def compute_window_for_date(cfg, target_date: date) -> Optional[DarknessWindow]:
+    """Cached darkness window for ``target_date`` using the astro_schedule config ``cfg``."""
+    return _compute_window(
+        target_date.toordinal(),
+        round(cfg.latitude, 4),
+        round(cfg.longitude, 4),
+        cfg.twilight_type,
+        cfg.start_offset_minutes,
+        cfg.end_offset_minutes
+    )
+
+
+class AstroTimerHub:
+    """
+    Runs timed callbacks for any number of schedulers on one shared thread.
+
+    Timers live in a heap of [deadline_ns, seq, callback] entries, with integer
+    deadlines on the time.monotonic_ns() clock. Cancelling clears the callback in place; the dead
+    entry is discarded when it reaches the top of the heap. Callbacks run on
+    the hub thread, one at a time, outside the lock.
+    """
+
+    def __init__(self):
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> list:
+        """Run ``callback`` after ``delay`` seconds. Returns a handle for cancel()."""
+        entry = [time.monotonic_ns() + int(delay * 1e9), next(self._seq), callback]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="astro-timer-hub", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return entry
+
+    def cancel(self, handle: list):
+        """Cancel a pending timer (no-op if it already ran)."""
+        with self._cond:
+            handle[2] = None
+
+    @staticmethod
+    def deadline(handle: list) -> Optional[int]:
+        """Deadline (monotonic ns) of a pending timer, or None if it ran or was cancelled."""
+        return handle[0] if handle[2] is not None else None
+
+    def _run(self):
+        """Hub thread: pop due timers and run their callbacks."""
+        heap = self._heap
+        while True:
+            with self._cond:
+                while True:
+                    while heap and heap[0][2] is None:
+                        heapq.heappop(heap)
+                    if not heap:
+                        self._cond.wait()
+                        continue
+                    wait_ns = heap[0][0] - time.monotonic_ns()
+                    if wait_ns > 0:
+                        self._cond.wait(timeout=wait_ns / 1e9)
+                        continue
+                    entry = heapq.heappop(heap)
+                    callback, entry[2] = entry[2], None
+                    break
+
+            try:
+                callback()
+            except Exception as e:
+                print(f"[ERROR] [TimerHub] Timer callback failed: {e}")
+
+
+# Shared by all AstroScheduler instances
+_timer_hub = AstroTimerHub()
+
+
+@dataclass(frozen=True)
+class SchedulerSnapshot:
+    """Immutable view of the scheduler state, published as a whole for readers."""
+    running: bool = False
+    capture_active: bool = False
+    current_session_date: Optional[str] = None
+    current_window: Optional[DarknessWindow] = None
 
 
 class AstroScheduler:
@@ -30,12 +149,20 @@ class AstroScheduler:
     """
 
     # Check interval in seconds
-    CHECK_INTERVAL = 15  # Check every 15 seconds for responsive start/stop
+    CHECK_INTERVAL = 15  # Fallback when the next transition time is unknown
+    MAX_CHECK_INTERVAL = 300  # Upper bound on a deadline sleep, so config edits are picked up
+    # Drift between the monotonic and wall clocks beyond which the window's
+    # monotonic bounds are re-anchored (suspend/resume, clock step)
+    CLOCK_RESYNC_TOLERANCE_NS = 2_000_000_000
+
+    # Capture session states (see _transition)
+    STATE_IDLE = 0
+    STATE_ACTIVE = 1
 
     def __init__(
         self,
         config_manager: ConfigManager,
-        on_start_capture: Optional[Callable[[], None]] = None,
+        on_start_capture: Optional[Callable[[str, str], None]] = None,
         on_stop_capture: Optional[Callable[[], None]] = None,
         on_session_complete: Optional[Callable[[str], None]] = None,
         on_log: Optional[Callable[[str, str], None]] = None
@@ -45,7 +172,7 @@ class AstroScheduler:
 
         Args:
             config_manager: Application configuration manager
-            on_start_capture: Callback to start capture
+            on_start_capture: Callback to start capture (receives start/end times HH:MM)
             on_stop_capture: Callback to stop capture
             on_session_complete: Callback when session completes (receives date string YYYYMMDD)
             on_log: Callback for log messages (level, message)
@@ -58,62 +185,172 @@ class AstroScheduler:
 
         # State
         self.running = False
-        self.monitor_thread: Optional[threading.Thread] = None
+        # Per-run cancellation token, checked by queued timer callbacks
         self.stop_event = threading.Event()
+        # Pending check on the shared timer hub (see _schedule_check)
+        self._timer: Optional[list] = None
+        self._timer_lock = threading.Lock()
 
         # Current session tracking
         self.current_session_date: Optional[str] = None
-        self.capture_active = False
+        self._state = self.STATE_IDLE
         self.current_window: Optional[DarknessWindow] = None
 
+        # Log messages queued by _log() and delivered in batches by _flush_logs()
+        # at the end of each check, so a slow on_log (Tk marshalling) never
+        # stalls a check. start()/stop() and session start/stop also flush
+        # before acting, so their messages precede the capture engine's own.
+        # Bounded: if nobody drains, the oldest messages are dropped.
+        self._log_queue: collections.deque = collections.deque(maxlen=1024)
+
+        # State as last published for other threads (see _publish_status). The
+        # scheduler thread swaps in a new frozen snapshot with a single attribute
+        # assignment, so get_status() readers need no lock and never see a
+        # half-updated mix of fields.
+        self._snapshot = SchedulerSnapshot()
+
+        # Tonight's window (memoized by _compute_window), held here so an
+        # unchanged config skips even the cache lookup (see _get_cached_window).
+        self._window: Optional[DarknessWindow] = None
+        # Its bounds in time.monotonic_ns() nanoseconds, converted when the
+        # window is acquired, so the per-check "in darkness?" test is an
+        # integer comparison. They are re-anchored whenever the monotonic-to-
+        # wall offset they were built with drifts by more than
+        # CLOCK_RESYNC_TOLERANCE_NS: CLOCK_MONOTONIC stops while the host is
+        # suspended, and the check deadlines follow the wall clock.
+        self._mono_start_ns = 0
+        self._mono_end_ns = 0
+        self._mono_offset_ns = 0
+        # (config version, evening date) the cached window was last validated
+        # against; while both match, even the key comparison is skipped.
+        self._window_version: Optional[tuple] = None
+
+        # Set view of cfg.scheduled_dates for O(1) membership tests. Rebuilt when
+        # the config's list is replaced or resized (see _get_scheduled_set).
+        self._scheduled_src: Optional[list] = None
+        self._scheduled_len = 0
+        self._scheduled_set: frozenset = frozenset()
+
+        # Runs on_session_complete (video export etc.) off the timer thread, so
+        # minutes of post-processing can't delay other schedulers' checks.
+        # Kept for the scheduler's lifetime: a check still running when stop()
+        # is called may submit to it, so it is never shut down under it. The
+        # worker thread is only started on the first submit.
+        self._post_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="scheduler-post"
+        )
+
+        # Date of the last check; a change means midnight passed (see _precompute_today)
+        self._last_date: Optional[date] = None
+
+        # Parsed manual window: (start_str, end_str, start_mins, end_mins, overnight).
+        # Re-parsed only when the configured strings change.
+        self._manual_cache: Optional[tuple] = None
+
     def start(self):
-        """Start the scheduler monitoring thread."""
+        """Start monitoring: register the first schedule check on the timer hub."""
         if self.running:
             return
 
         self.running = True
-        # Fresh event per run so a previous (stopping) thread keeps its own
-        # signalled event and exits, even though stop() no longer joins it.
+        self._publish_status()
+        # Fresh event per run so a check already running for a previous run
+        # sees its own signalled event and doesn't re-register itself.
         self.stop_event = threading.Event()
-
-        self.monitor_thread = threading.Thread(
-            target=self._monitor_loop, args=(self.stop_event,), daemon=True
-        )
-        self.monitor_thread.start()
-
         self._log("INFO", "Astronomical scheduler started")
+        self._flush_logs()
+        self._schedule_check(0.0)
+
+        # Fill the window cache for the scheduled nights off the hub thread,
+        # so the first check on each night is a cache hit.
+        threading.Thread(target=self._prewarm_windows, daemon=True).start()
 
     def stop(self):
-        """Stop the scheduler monitoring thread.
-
-        Signals the monitor thread and returns immediately — we deliberately do
-        NOT join here. stop() is called from the GUI thread (the "Enable
-        automatic scheduling" toggle), and joining would freeze the UI until the
-        daemon thread unwinds, visible as a lag before the checkbox clears. The
-        thread is a daemon and exits on its own once its stop_event is set; each
-        run owns its event (see start()), so this can't race a later restart.
+        """Stop monitoring.
+
+        Cancels the pending check and returns immediately — we deliberately do
+        NOT wait for a check that is already running on the hub thread. stop()
+        is called from the GUI thread (the "Enable automatic scheduling"
+        toggle), and waiting would freeze the UI, visible as a lag before the
+        checkbox clears. A running check sees its run's stop_event set and
+        doesn't re-register; each run owns its event (see start()), so this
+        can't race a later restart.
         """
         if not self.running:
             return
 
         self.running = False
-        self.stop_event.set()
-        self.monitor_thread = None
+        self._publish_status()
+        with self._timer_lock:
+            self.stop_event.set()
+            if self._timer is not None:
+                _timer_hub.cancel(self._timer)
+                self._timer = None
+        # Already-queued post-processing still runs; we just don't wait for it
 
         self._log("INFO", "Astronomical scheduler stopped")
+        self._flush_logs()
+
+    @property
+    def capture_active(self) -> bool:
+        """True while a scheduled capture session is running."""
+        return self._state == self.STATE_ACTIVE
+
+    @capture_active.setter
+    def capture_active(self, active: bool):
+        self._state = self.STATE_ACTIVE if active else self.STATE_IDLE
+
+    def _prewarm_windows(self):
+        """Compute (and cache) darkness windows for upcoming scheduled dates."""
+        cfg = self.config_manager.astro_schedule
+        if cfg.use_manual_times or (cfg.latitude == 0.0 and cfg.longitude == 0.0):
+            return
+
+        # Yesterday's window may still be in progress (overnight session)
+        earliest = date.today() - timedelta(days=1)
+        for date_str in list(cfg.scheduled_dates):
+            try:
+                target_date = date.fromisoformat(date_str)
+                if target_date >= earliest:
+                    compute_window_for_date(cfg, target_date)
+            except ValueError:
+                # Malformed date or twilight type - the schedule check reports config errors
+                continue
+
+    def wake(self):
+        """Force an immediate schedule re-check (e.g. after a config change).
+
+        Checks otherwise run only at the next expected transition.
+        """
+        if self.running:
+            self._schedule_check(0.0)
+
+    def notify_config_changed(self):
+        """Tell the scheduler the astro_schedule settings were edited.
+
+        Drops the scheduled-date set (in-place list edits aren't tracked by the
+        config version) and re-checks immediately so the change takes effect
+        now rather than at the next scheduled transition.
+        """
+        self._scheduled_src = None
+        self.wake()
 
     def is_running(self) -> bool:
         """Check if scheduler is running."""
         return self.running
 
     def get_status(self) -> dict:
-        """Get current scheduler status."""
-        return {
-            "running": self.running,
-            "capture_active": self.capture_active,
-            "current_session_date": self.current_session_date,
-            "current_window": self.current_window
-        }
+        """Get current scheduler status (from the last published snapshot)."""
+        return dict(vars(self._snapshot))
+
+    def _publish_status(self):
+        """Publish the current state as a new snapshot for get_status() readers."""
+        self._snapshot = SchedulerSnapshot(
+            running=self.running,
+            capture_active=self.capture_active,
+            current_session_date=self.current_session_date,
+            current_window=self.current_window
+        )
 
     def get_tonight_window(self) -> Optional[DarknessWindow]:
         """Get the darkness window for tonight based on current config."""
@@ -122,110 +359,248 @@ class AstroScheduler:
         if cfg.latitude == 0.0 and cfg.longitude == 0.0:
             return None
 
-        calc = TwilightCalculator(cfg.latitude, cfg.longitude)
-        return calc.get_tonight_window(
-            twilight_type=cfg.twilight_type,
-            start_offset_minutes=cfg.start_offset_minutes,
-            end_offset_minutes=cfg.end_offset_minutes
-        )
-
-    def _monitor_loop(self, stop_event: threading.Event):
-        """Main monitoring loop - checks schedule and controls capture.
+        return self._get_cached_window(cfg, datetime.now())
 
-        Uses the per-run ``stop_event`` passed in by start() (not
-        ``self.stop_event``) so a stopping thread always watches its own event
-        and exits cleanly even after a new run has begun.
+    def _get_cached_window(self, cfg, now: datetime) -> Optional[DarknessWindow]:
+        """Return tonight's darkness window, recomputing only when its inputs change."""
+        # Same evening-date rule as TwilightCalculator.get_tonight_window():
+        # before noon we may still be inside last night's window.
+        if now.hour < 12:
+            target_date = (now - timedelta(days=1)).date()
+        else:
+            target_date = now.date()
+
+        version = (cfg.version, target_date)
+        if version == self._window_version:
+            return self._window
+
+        window = compute_window_for_date(cfg, target_date)
+        if window is not self._window and window is not None:
+            self._anchor_window(window, time.monotonic_ns() - time.time_ns())
+        self._window = window
+        self._window_version = version
+        return window
+
+    def _anchor_window(self, window: DarknessWindow, mono_offset_ns: int):
+        """Convert the window's bounds to monotonic nanoseconds using mono_offset_ns."""
+        self._mono_offset_ns = mono_offset_ns
+        self._mono_start_ns = int(window.darkness_start.timestamp() * 1e9) + mono_offset_ns
+        self._mono_end_ns = int(window.darkness_end.timestamp() * 1e9) + mono_offset_ns
+
+    def _schedule_check(self, delay: float, stop_event: Optional[threading.Event] = None):
+        """Register the next schedule check on the shared timer hub.
+
+        Keeps whichever of the pending and the new check is due first, so a
+        wake() that lands while a check is running isn't overwritten when that
+        check re-registers for its (later) next transition.
         """
-        self._log("INFO", "Scheduler monitor loop started")
-
-        while not stop_event.is_set():
-            try:
-                self._check_schedule()
-            except Exception as e:
-                self._log("ERROR", f"Scheduler error: {e}")
-
-            # Wait for next check interval
-            stop_event.wait(timeout=self.CHECK_INTERVAL)
-
-        self._log("INFO", "Scheduler monitor loop ended")
+        stop_event = stop_event or self.stop_event
+        with self._timer_lock:
+            if stop_event.is_set():
+                return
+            if self._timer is not None:
+                pending = _timer_hub.deadline(self._timer)
+                if pending is not None and pending <= time.monotonic_ns() + int(delay * 1e9):
+                    return
+                _timer_hub.cancel(self._timer)
+            self._timer = _timer_hub.schedule(
+                delay, functools.partial(self._run_check, stop_event)
+            )
+
+    def _run_check(self, stop_event: threading.Event):
+        """Timer callback - checks schedule and controls capture.
+
+        Uses the per-run ``stop_event`` bound by _schedule_check() (not
+        ``self.stop_event``) so a check queued for a stopped run never
+        re-registers itself, even after a new run has begun.
+
+        Rather than polling, each check re-registers for the next expected
+        transition (window start/end or a date boundary), capped at
+        MAX_CHECK_INTERVAL. wake() brings the next check forward.
+        """
+        with self._timer_lock:
+            if stop_event.is_set():
+                return
+            self._timer = None
 
-    def _check_schedule(self):
-        """Check if we should start or stop capture based on schedule."""
+        next_event = None
+        try:
+            next_event = self._check_schedule()
+        except Exception as e:
+            self._log("ERROR", f"Scheduler error: {e}")
+        self._flush_logs()
+
+        self._schedule_check(self._seconds_until(next_event), stop_event)
+
+    def _seconds_until(self, next_event: Optional[datetime]) -> float:
+        """Delay before the next check given the next transition time."""
+        if next_event is None:
+            return self.CHECK_INTERVAL
+        remaining = (next_event - datetime.now()).total_seconds()
+        return max(1.0, min(self.MAX_CHECK_INTERVAL, remaining))
+
+    @staticmethod
+    def _next_time_of_day(now: datetime, minutes: int) -> datetime:
+        """First datetime after ``now`` whose wall-clock time is ``minutes`` past midnight."""
+        candidate = datetime.combine(now.date(), dtime(minutes // 60, minutes % 60))
+        if candidate <= now:
+            candidate += timedelta(days=1)
+        return candidate
+
+    def _get_scheduled_set(self, scheduled_dates: list) -> frozenset:
+        """Return scheduled_dates as a frozenset, rebuilding it only when the list changes."""
+        if scheduled_dates is not self._scheduled_src or len(scheduled_dates) != self._scheduled_len:
+            self._scheduled_set = frozenset(scheduled_dates)
+            self._scheduled_src = scheduled_dates
+            self._scheduled_len = len(scheduled_dates)
+        return self._scheduled_set
+
+    def _check_schedule(self) -> Optional[datetime]:
+        """Check if we should start or stop capture based on schedule.
+
+        Returns:
+            The next time the schedule can change state (window start/end or a
+            date boundary), or None if it can't be determined.
+        """
         cfg = self.config_manager.astro_schedule
 
         # No scheduled dates: stop any active session, then bail.
         # (e.g. user cleared the calendar mid-capture)
         if not cfg.scheduled_dates:
-            if self.capture_active:
-                self._stop_capture_session()
-            return
+            self._transition(False)
+            return None
 
+        scheduled = self._get_scheduled_set(cfg.scheduled_dates)
         now = datetime.now()
-        today_str = now.strftime("%Y-%m-%d")
+        today = now.date()
+        today_str = today.isoformat()  # YYYY-MM-DD, cheaper than strftime
+        # Scheduled-date checks flip at midnight
+        next_midnight = self._next_time_of_day(now, 0)
+
+        if today != self._last_date:
+            self._last_date = today
+            self._precompute_today(cfg, today_str, scheduled)
 
         # Check if today is scheduled
-        if today_str not in cfg.scheduled_dates:
+        if today_str not in scheduled:
             # Also check yesterday (for overnight sessions that started yesterday)
-            yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
-            if yesterday not in cfg.scheduled_dates:
+            yesterday = (today - timedelta(days=1)).isoformat()
+            if yesterday not in scheduled:
                 # Neither today nor yesterday is scheduled
-                if self.capture_active:
-                    self._stop_capture_session()
-                return
+                self._transition(False)
+                return next_midnight
             else:
                 # Yesterday was scheduled - only continue if session is already active
                 # Don't start a NEW session for today if today isn't scheduled
                 if not self.capture_active:
-                    return  # Yesterday's session already ended, don't start new one
+                    return next_midnight  # Yesterday's session already ended, don't start new one
 
         # Check which mode we're using
         if cfg.use_manual_times:
             # Manual time mode - use fixed start/end times
-            self._check_manual_schedule(now, today_str)
+            in_window, info, next_event = self._check_manual_schedule(now, today_str)
         else:
             # Twilight-based mode - use astronomical calculations
-            self._check_twilight_schedule(now)
+            in_window, info, next_event = self._check_twilight_schedule(now)
+        if in_window is not None:
+            self._transition(in_window, info)
+        self._publish_status()
+
+        if next_event is None:
+            return None
+        return min(next_event, next_midnight)
+
+    def _transition(self, in_window: bool, info=None):
+        """Drive the IDLE/ACTIVE session state from the current window check.
 
-    def _check_manual_schedule(self, now: datetime, today_str: str):
-        """Check manual time-based schedule."""
+        The one place sessions start and stop: IDLE inside the window starts a
+        session, ACTIVE outside it stops one, anything else is a no-op.
+
+        Args:
+            in_window: Whether now falls inside the capture window
+            info: Window to start with - a DarknessWindow, or a
+                (date_str, start_time, end_time) tuple in manual mode
+        """
+        if in_window == (self._state == self.STATE_ACTIVE):
+            return
+
+        if not in_window:
+            self._stop_capture_session()
+        elif isinstance(info, tuple):
+            self._start_capture_session_manual(*info)
+        else:
+            self._start_capture_session(info)
+
+    def _precompute_today(self, cfg, today_str: str, scheduled: frozenset):
+        """Midnight rollover: compute tonight's darkness window ahead of time.
+
+        Runs on the first check of each day (checks are always scheduled for
+        midnight), so the window is in the cache long before darkness begins
+        and the check that starts the session does no twilight math.
+        """
+        if today_str not in scheduled or cfg.use_manual_times:
+            return
+        if cfg.latitude == 0.0 and cfg.longitude == 0.0:
+            return
+        try:
+            compute_window_for_date(cfg, date.fromisoformat(today_str))
+        except ValueError as e:
+            self._log("WARNING", f"Could not precompute darkness window: {e}")
+
+    def _check_manual_schedule(self, now: datetime, today_str: str) -> tuple:
+        """Check manual time-based schedule.
+
+        Returns:
+            (in_window, (date_str, start_time, end_time), next start/end boundary)
+        """
         cfg = self.config_manager.astro_schedule
 
         start_time_str = cfg.manual_start_time
         end_time_str = cfg.manual_end_time
+        info = (today_str, start_time_str, end_time_str)
 
         # Check if within manual time window
         in_window = self._is_within_manual_window(now, start_time_str, end_time_str)
 
-        if in_window:
-            if not self.capture_active:
-                # Start capture with manual times
-                self.config_manager.schedule.start_time = start_time_str
-                self.config_manager.schedule.end_time = end_time_str
-                self._start_capture_session_manual(today_str, start_time_str, end_time_str)
-        else:
-            if self.capture_active:
-                # Stop capture - outside manual window
-                self._stop_capture_session()
+        try:
+            start_mins, end_mins, _ = self._parse_manual_window(start_time_str, end_time_str)
+        except (ValueError, IndexError):
+            return in_window, info, None
+        return in_window, info, min(
+            self._next_time_of_day(now, start_mins),
+            self._next_time_of_day(now, end_mins)
+        )
+
+    def _parse_manual_window(self, start_str: str, end_str: str) -> tuple:
+        """Return (start_mins, end_mins, overnight) for the manual window.
+
+        Parsed once and cached until the configured strings change.
+        Raises ValueError/IndexError on a malformed time.
+        """
+        cache = self._manual_cache
+        if cache is not None and cache[0] == start_str and cache[1] == end_str:
+            return cache[2:]
+
+        start_parts = start_str.split(":")
+        end_parts = end_str.split(":")
+        start_mins = int(start_parts[0]) * 60 + int(start_parts[1])
+        end_mins = int(end_parts[0]) * 60 + int(end_parts[1])
+        overnight = end_mins < start_mins
+
+        self._manual_cache = (start_str, end_str, start_mins, end_mins, overnight)
+        return start_mins, end_mins, overnight
 
     def _is_within_manual_window(self, now: datetime, start_str: str, end_str: str) -> bool:
         """Check if current time is within manual start/end window."""
         try:
-            start_parts = start_str.split(":")
-            end_parts = end_str.split(":")
-            start_hour, start_min = int(start_parts[0]), int(start_parts[1])
-            end_hour, end_min = int(end_parts[0]), int(end_parts[1])
-
+            start_mins, end_mins, _ = self._parse_manual_window(start_str, end_str)
             current_mins = now.hour * 60 + now.minute
-            start_mins = start_hour * 60 + start_min
-            end_mins = end_hour * 60 + end_min
 
-            # Handle overnight windows (e.g., 22:00 - 06:00)
-            if end_mins < start_mins:
-                # Overnight window
-                return current_mins >= start_mins or current_mins < end_mins
-            else:
-                # Same day window (e.g., 10:00 - 14:00)
-                return start_mins <= current_mins < end_mins
+            # Minutes since the window opened vs. the window's length, both mod
+            # 1440. The modulus wraps overnight windows (e.g., 22:00 - 06:00) onto
+            # the same comparison as same-day ones (e.g., 10:00 - 14:00): start is
+            # inclusive, end exclusive, and start == end is an empty window.
+            return (current_mins - start_mins) % 1440 < (end_mins - start_mins) % 1440
 
         except (ValueError, IndexError):
             self._log("ERROR", f"Invalid manual time format: {start_str} - {end_str}")
@@ -235,92 +610,123 @@ class AstroScheduler:
         """Start a capture session with manual times."""
         self.capture_active = True
         self.current_session_date = date_str.replace("-", "")
+        self._publish_status()
 
         self._log("INFO", f"Starting scheduled capture session for {self.current_session_date}")
         self._log("INFO", f"Manual window: {start_time} - {end_time}")
-
-        # Update the capture schedule times in config
-        self.config_manager.schedule.start_time = start_time
-        self.config_manager.schedule.end_time = end_time
+        self._flush_logs()
 
         if self.on_start_capture:
-            self.on_start_capture()
+            self.on_start_capture(start_time, end_time)
+
+    def _check_twilight_schedule(self, now: datetime) -> tuple:
+        """Check twilight-based schedule.
 
-    def _check_twilight_schedule(self, now: datetime):
-        """Check twilight-based schedule."""
+        Returns:
+            (in_window, window, next window start/end). in_window is None when
+            no window can be determined, leaving the session state untouched.
+        """
         cfg = self.config_manager.astro_schedule
 
         # Skip if location not set
         if cfg.latitude == 0.0 and cfg.longitude == 0.0:
-            return
+            return None, None, None
 
-        # Get tonight's darkness window
-        calc = TwilightCalculator(cfg.latitude, cfg.longitude)
-        window = calc.get_tonight_window(
-            twilight_type=cfg.twilight_type,
-            start_offset_minutes=cfg.start_offset_minutes,
-            end_offset_minutes=cfg.end_offset_minutes
-        )
+        # Get tonight's darkness window (cached between checks)
+        window = self._get_cached_window(cfg, now)
 
         if not window:
             self._log("WARNING", "Could not calculate darkness window (polar day/night?)")
-            return
+            return None, None, None
 
         self.current_window = window
 
-        # Check if we're within the darkness window
-        if window.is_active_now():
-            if not self.capture_active:
-                # Start capture
-                self._start_capture_session(window)
-        else:
-            if self.capture_active:
-                # Stop capture - darkness ended
-                self._stop_capture_session()
+        # Check if we're within the darkness window (same bounds as
+        # DarknessWindow.is_active_now(), on the monotonic clock)
+        mono_now = time.monotonic_ns()
+        mono_offset_ns = mono_now - time.time_ns()
+        if abs(mono_offset_ns - self._mono_offset_ns) > self.CLOCK_RESYNC_TOLERANCE_NS:
+            self._log("INFO", "Clock jump detected (suspend/resume?) - re-anchoring darkness window")
+            self._anchor_window(window, mono_offset_ns)
+        in_window = self._mono_start_ns <= mono_now <= self._mono_end_ns
+
+        if now < window.darkness_start:
+            return in_window, window, window.darkness_start
+        if now <= window.darkness_end:
+            return in_window, window, window.darkness_end
+        # Window is over; tonight's window takes over at noon (see _get_cached_window)
+        return in_window, window, self._next_time_of_day(now, 12 * 60)
 
     def _start_capture_session(self, window: DarknessWindow):
         """Start a capture session."""
         self.capture_active = True
         self.current_session_date = window.date.strftime("%Y%m%d")
+        self.current_window = window
+        self._publish_status()
 
         self._log("INFO", f"Starting scheduled capture session for {self.current_session_date}")
         self._log("INFO", f"Darkness window: {window.get_time_range_str()} ({window.get_duration_str()})")
+        self._flush_logs()
 
-        # Update the capture schedule times in config to match twilight times
-        self.config_manager.schedule.start_time = window.darkness_start.strftime("%H:%M")
-        self.config_manager.schedule.end_time = window.darkness_end.strftime("%H:%M")
-
+        # Hand the twilight times to the capture side rather than writing them
+        # into the shared config from this thread
         if self.on_start_capture:
-            self.on_start_capture()
+            self.on_start_capture(
+                window.darkness_start.strftime("%H:%M"),
+                window.darkness_end.strftime("%H:%M")
+            )
 
     def _stop_capture_session(self):
         """Stop a capture session and trigger post-processing."""
         session_date = self.current_session_date
 
         self._log("INFO", f"Stopping scheduled capture session for {session_date}")
+        self._flush_logs()
 
         # Clear the flag BEFORE notifying the UI: on_stop_capture() triggers the
         # status-label refresh, which must read the post-stop state ("waiting"),
         # not the stale "Capturing".
         self.capture_active = False
+        self._publish_status()
 
-        if self.on_stop_capture:
-            self.on_stop_capture()
-
-        # Trigger session complete callback (for auto video creation)
-        if session_date and self.on_session_complete:
-            self._log("INFO", f"Session complete - triggering post-processing for {session_date}")
+        try:
+            if self.on_stop_capture:
+                self.on_stop_capture()
+
+            # Trigger session complete callback (for auto video creation) on the
+            # post-processing worker
+            if session_date and self.on_session_complete:
+                self._log("INFO", f"Session complete - triggering post-processing for {session_date}")
+                self._post_executor.submit(self._run_session_complete, session_date)
+        finally:
+            self.current_session_date = None
+            self.current_window = None
+            self._publish_status()
+
+    def _run_session_complete(self, session_date: str):
+        """Post-processing worker: run on_session_complete, logging any failure."""
+        try:
             self.on_session_complete(session_date)
-
-        self.current_session_date = None
-        self.current_window = None
+        except Exception as e:
+            self._log("ERROR", f"Post-processing failed for {session_date}: {e}")
+            self._flush_logs()
 
     def _log(self, level: str, message: str):
-        """Log a message."""
-        if self.on_log:
-            self.on_log(level, f"[Scheduler] {message}")
-        else:
-            print(f"[{level}] [Scheduler] {message}")
+        """Queue a log message (delivered by _flush_logs)."""
+        self._log_queue.append((level, message))
+
+    def _flush_logs(self):
+        """Deliver all queued log messages to on_log (or stdout)."""
+        queue = self._log_queue
+        while True:
+            try:
+                level, message = queue.popleft()
+            except IndexError:
+                return
+            if self.on_log:
+                self.on_log(level, f"[Scheduler] {message}")
+            else:
+                print(f"[{level}] [Scheduler] {message}")
 
 
 def test_scheduler():
@@ -338,8 +744,8 @@ def test_scheduler():
     today = date.today().strftime("%Y-%m-%d")
     config.astro_schedule.scheduled_dates = [today]
 
-    def on_start():
-        print(">>> CAPTURE STARTED")
+    def on_start(start_time, end_time):
+        print(f">>> CAPTURE STARTED ({start_time} - {end_time})")
 
     def on_stop():
         print(">>> CAPTURE STOPPED")
@@ -9,17 +9,60 @@ Features:
 - Select All / Clear All buttons
 """
 
+import functools
+import os
 import tkinter as tk
 from tkinter import ttk
 from datetime import datetime, date, timedelta
 from typing import Set, Callable, Optional
 from pathlib import Path
+from types import MappingProxyType
 import calendar
 
-try:
-    from src.capture_history import get_capture_history, CaptureHistoryManager
-except ImportError:
-    from capture_history import get_capture_history, CaptureHistoryManager
+from capture_history import get_capture_history, CaptureHistoryManager
+
+
+# Visual styling (read-only; also TwoMonthCalendar.COLORS)
+COLORS = MappingProxyType({
+    "captured": "#90EE90",      # Light green - past date with images
+    "scheduled": "#87CEEB",     # Light blue - future date selected
+    "past": "#E0E0E0",          # Gray - past date without captures
+    "today_bg": "#FFFFFF",      # White background for today
+    "today_border": "#FF6B6B",  # Red border for today
+    "future": "#FFFFFF",        # White - future date not selected
+    "header": "#4A90D9",        # Blue header
+    "weekend": "#F5F5F5",       # Slightly gray for weekends
+})
+
+# Pre-resolved colors for the per-cell paint path
+_COLOR_FUTURE = COLORS["future"]
+_COLOR_TODAY_BORDER = COLORS["today_border"]
+
+# Day cell background, keyed by (sign of date - today, is_selected,
+# is_captured). Captures are only looked up for past dates, and past
+# dates can't be selected in practice (clicks on them are ignored).
+_COLOR_LUT = {
+    (-1, False, False): COLORS["past"],
+    (-1, False, True): COLORS["captured"],
+    (-1, True, False): COLORS["past"],
+    (-1, True, True): COLORS["captured"],
+    (0, False, False): COLORS["today_bg"],
+    (0, True, False): COLORS["scheduled"],
+    (1, False, False): COLORS["future"],
+    (1, True, False): COLORS["scheduled"],
+}
+
+DAY_NAMES = ("Su", "Mo", "Tu", "We", "Th", "Fr", "Sa")
+
+_CALENDAR = calendar.Calendar(firstweekday=6)  # Sunday first
+
+
+@functools.lru_cache(maxsize=64)
+def _month_days(year: int, month: int) -> tuple:
+    """Day numbers of a month's 6x7 grid (0 = cell outside the month)."""
+    days = tuple(_CALENDAR.itermonthdays(year, month))
+    # Pad to 42 days (6 weeks)
+    return days + (0,) * (42 - len(days))
 
 
 class TwoMonthCalendar(ttk.Frame):
@@ -30,19 +73,15 @@ class TwoMonthCalendar(ttk.Frame):
     Checks snapshots folder to show which dates have captures.
     """
 
-    # Visual styling
-    COLORS = {
-        "captured": "#90EE90",      # Light green - past date with images
-        "scheduled": "#87CEEB",     # Light blue - future date selected
-        "past": "#E0E0E0",          # Gray - past date without captures
-        "today_bg": "#FFFFFF",      # White background for today
-        "today_border": "#FF6B6B",  # Red border for today
-        "future": "#FFFFFF",        # White - future date not selected
-        "header": "#4A90D9",        # Blue header
-        "weekend": "#F5F5F5",       # Slightly gray for weekends
-    }
+    # Visual styling (module-level, read-only)
+    COLORS = COLORS
+    DAY_NAMES = DAY_NAMES
 
-    DAY_NAMES = ["Su", "Mo", "Tu", "We", "Th", "Fr", "Sa"]
+    # Month grid geometry (pixels): each day cell is a 30x26 box in a 32x28
+    # slot, below a row of day names
+    CELL_W = 32
+    CELL_H = 28
+    NAME_ROW_H = 20
 
     def __init__(
         self,
@@ -66,14 +105,40 @@ class TwoMonthCalendar(ttk.Frame):
         self.capture_history = get_capture_history()
 
         # Selected dates (future dates user wants to capture)
-        self.selected_dates: Set[str] = set()  # Format: "YYYY-MM-DD"
+        # Held as packed ints (year*10000 + month*100 + day, i.e. YYYYMMDD) so
+        # redraws test membership without formatting a string per cell;
+        # get/set_selected_dates convert to/from "YYYY-MM-DD".
+        self._selected_keys: Set[int] = set()
 
         # Current view: first day of the left month
         today = date.today()
         self.view_date = date(today.year, today.month, 1)
 
-        # Store day label references for updating
-        self._day_labels = {}  # {(month_offset, row, col): label}
+        # Store widget/item references for updating
+        self._month_headers = {}  # {month_offset: header label}
+        self._canvases = {}  # {month_offset: month grid canvas}
+        self._cell_ids = {}  # {(month_offset, row, col): (rect_id, text_id)}
+        # Last (text, bg, border width) applied to each day cell, so a redraw
+        # only reconfigures the cells that actually changed
+        self._cell_state = {}  # {(month_offset, row, col): (text, bg, border)}
+
+        # YYYYMMDD folders in snapshots_dir holding at least one image, rebuilt
+        # by one scandir sweep per redraw (see _refresh_captured_cache)
+        self._captured_cache: Set[str] = set()
+        # {folder name: (mtime_ns, has_images)} - a folder whose mtime hasn't
+        # changed since the last sweep isn't listed again
+        self._captured_cache_mtime: dict = {}
+        # (snapshots_dir, its mtime_ns, today) as of the last sweep; while it
+        # is unchanged the sweep is skipped (see invalidate_captures_cache)
+        self._snapshots_mtime: Optional[tuple] = None
+
+        # Redraws and selection callbacks requested in a burst are coalesced
+        # into one idle-time pass (see _request_redraw / _do_redraw). While
+        # the calendar isn't viewable (another notebook tab is selected) a
+        # redraw stays pending until redraw_if_shown() is called.
+        self._redraw_pending = False
+        self._notify_pending = False
+        self._idle_scheduled = False
 
         self._create_widgets()
         self._update_display()
@@ -158,39 +223,54 @@ class TwoMonthCalendar(ttk.Frame):
         """
         # Month/Year header
         header = ttk.Label(parent, text="", font=("Segoe UI", 9, "bold"))
-        header.grid(row=0, column=0, columnspan=7, pady=(0, 5))
-        self._day_labels[(month_offset, -1, 0)] = header  # Store header reference
+        header.grid(row=0, column=0, pady=(0, 5))
+        self._month_headers[month_offset] = header
+
+        # Day names and day cells are items on one canvas rather than a
+        # widget per cell
+        canvas = tk.Canvas(
+            parent,
+            width=7 * self.CELL_W,
+            height=self.NAME_ROW_H + 6 * self.CELL_H,
+            highlightthickness=0,
+            cursor="hand2"
+        )
+        frame_bg = ttk.Style(self).lookup("TFrame", "background")
+        if frame_bg:
+            canvas.configure(bg=frame_bg)
+        canvas.grid(row=1, column=0)
+        self._canvases[month_offset] = canvas
 
         # Day name headers
         for col, day_name in enumerate(self.DAY_NAMES):
-            lbl = ttk.Label(parent, text=day_name, font=("Segoe UI", 8), width=3, anchor="center")
-            lbl.grid(row=1, column=col, padx=1, pady=1)
+            canvas.create_text(
+                col * self.CELL_W + self.CELL_W // 2, self.NAME_ROW_H // 2,
+                text=day_name, font=("Segoe UI", 8)
+            )
 
         # Day cells (6 rows x 7 columns)
         for row in range(6):
             for col in range(7):
-                # Create a frame for each day cell (to handle border)
-                cell_frame = tk.Frame(parent, width=30, height=26)
-                cell_frame.grid(row=row + 2, column=col, padx=1, pady=1)
-                cell_frame.grid_propagate(False)
-
-                # Label inside the frame
-                lbl = tk.Label(
-                    cell_frame,
-                    text="",
-                    font=("Segoe UI", 9),
-                    width=3,
-                    height=1,
-                    cursor="hand2"
-                )
-                lbl.place(relx=0.5, rely=0.5, anchor="center")
-
-                # Bind click event
-                lbl.bind("<Button-1>", lambda e, mo=month_offset, r=row, c=col: self._on_day_click(mo, r, c))
-                cell_frame.bind("<Button-1>", lambda e, mo=month_offset, r=row, c=col: self._on_day_click(mo, r, c))
+                x = col * self.CELL_W + 1
+                y = self.NAME_ROW_H + row * self.CELL_H + 1
+                rect_id = canvas.create_rectangle(x, y, x + 30, y + 26, outline="", width=0)
+                text_id = canvas.create_text(x + 15, y + 13, text="", font=("Segoe UI", 9))
 
                 # Store references
-                self._day_labels[(month_offset, row, col)] = (cell_frame, lbl)
+                self._cell_ids[(month_offset, row, col)] = (rect_id, text_id)
+
+        # One shared click handler (a bound method, no per-month closure); the
+        # month comes from the canvas, the cell from the click coordinates
+        canvas.month_offset = month_offset
+        canvas.bind("<Button-1>", self._on_canvas_click)
+
+    def _on_canvas_click(self, event):
+        """Map a click on a month canvas to its day cell"""
+        month_offset = event.widget.month_offset
+        row = (event.y - self.NAME_ROW_H) // self.CELL_H
+        col = event.x // self.CELL_W
+        if event.y >= self.NAME_ROW_H and 0 <= row < 6 and 0 <= col < 7:
+            self._on_day_click(month_offset, row, col)
 
     def _create_legend_item(self, parent: ttk.Frame, color: str, text: str):
         """Create a legend item with color box and label"""
@@ -204,6 +284,9 @@ class TwoMonthCalendar(ttk.Frame):
 
     def _update_display(self):
         """Update the calendar display"""
+        today = date.today()
+        self._refresh_captured_cache(today)
+
         # Update month header label
         left_month = self.view_date
         right_month = self._add_months(self.view_date, 1)
@@ -213,124 +296,151 @@ class TwoMonthCalendar(ttk.Frame):
         )
 
         # Update left month
-        self._update_month_grid(0, left_month)
+        self._update_month_grid(0, left_month, today)
 
         # Update right month
-        self._update_month_grid(1, right_month)
+        self._update_month_grid(1, right_month, today)
 
-    def _update_month_grid(self, month_offset: int, month_date: date):
+    def _update_month_grid(self, month_offset: int, month_date: date, today: date):
         """Update a single month grid"""
         # Update header
-        header = self._day_labels[(month_offset, -1, 0)]
+        header = self._month_headers[month_offset]
         header.config(text=month_date.strftime("%B %Y"))
 
         # Get calendar data
-        cal = calendar.Calendar(firstweekday=6)  # Sunday first
-        month_days = list(cal.itermonthdays(month_date.year, month_date.month))
-
-        # Pad to 42 days (6 weeks)
-        while len(month_days) < 42:
-            month_days.append(0)
-
-        today = date.today()
+        month_days = _month_days(month_date.year, month_date.month)
 
         # Update each cell
         for row in range(6):
             for col in range(7):
-                idx = row * 7 + col
-                day = month_days[idx]
-
-                cell_frame, lbl = self._day_labels[(month_offset, row, col)]
-
-                if day == 0:
-                    # Empty cell
-                    lbl.config(text="", bg=self.COLORS["future"])
-                    cell_frame.config(bg=self.COLORS["future"], highlightthickness=0)
-                else:
-                    current_date = date(month_date.year, month_date.month, day)
-                    date_str = current_date.strftime("%Y-%m-%d")
-
-                    lbl.config(text=str(day))
-
-                    # Determine cell status and color
-                    status = self._get_date_status(current_date, date_str)
-                    bg_color = self._get_status_color(status)
-
-                    lbl.config(bg=bg_color)
-                    cell_frame.config(bg=bg_color)
-
-                    # Special border for today
-                    if current_date == today:
-                        cell_frame.config(
-                            highlightbackground=self.COLORS["today_border"],
-                            highlightthickness=2
-                        )
-                    else:
-                        cell_frame.config(highlightthickness=0)
+                day = month_days[row * 7 + col]
+                current_date = date(month_date.year, month_date.month, day) if day else None
+                self._paint_cell(month_offset, row, col, current_date, today)
+
+    def _paint_cell(self, month_offset: int, row: int, col: int,
+                    current_date: Optional[date], today: date):
+        """Color a single day cell (current_date None = empty cell)"""
+        if current_date is None:
+            # Empty cell
+            new_state = ("", _COLOR_FUTURE, 0)
+        else:
+            key = current_date.year * 10000 + current_date.month * 100 + current_date.day
 
-    def _get_date_status(self, current_date: date, date_str: str) -> str:
-        """
-        Determine the status of a date.
+            # Determine cell color: past (captured or not), today or future
+            # (scheduled or not)
+            cmp = (current_date > today) - (current_date < today)
+            captured = cmp < 0 and self._has_captures(current_date)
+            bg_color = _COLOR_LUT[(cmp, key in self._selected_keys, captured)]
+
+            # Special border for today
+            new_state = (str(current_date.day), bg_color, 2 if current_date == today else 0)
+
+        key = (month_offset, row, col)
+        old_state = self._cell_state.get(key)
+        if new_state == old_state:
+            return
 
-        Returns: "captured", "scheduled", "past", "today", or "future"
+        # Only issue the Tk calls for the parts that changed
+        canvas = self._canvases[month_offset]
+        rect_id, text_id = self._cell_ids[key]
+        text, bg_color, border = new_state
+        if old_state is None or old_state[0] != text:
+            canvas.itemconfigure(text_id, text=text)
+        if old_state is None or old_state[1:] != new_state[1:]:
+            canvas.itemconfigure(
+                rect_id,
+                fill=bg_color,
+                outline=_COLOR_TODAY_BORDER if border else "",
+                width=border
+            )
+        self._cell_state[key] = new_state
+
+    def _refresh_captured_cache(self, today: Optional[date] = None):
+        """Rebuild the set of date folders that contain captured images.
+
+        Skipped (one stat) while snapshots_dir's own mtime and the date are
+        unchanged since the last sweep. Images landing in an existing date
+        folder don't touch that mtime - producers call
+        invalidate_captures_cache(), and the date check rescans daily.
+        Otherwise one scandir of snapshots_dir; a date folder is only listed
+        again when its mtime changed since the previous sweep.
         """
-        today = date.today()
+        try:
+            dir_mtime = os.stat(self.snapshots_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        gate = (self.snapshots_dir, dir_mtime, today or date.today())
+        if gate == self._snapshots_mtime:
+            return
 
-        if current_date < today:
-            # Past date - check if captured
-            if self._has_captures(current_date):
-                return "captured"
-            return "past"
-        elif current_date == today:
-            # Today - check if scheduled
-            if date_str in self.selected_dates:
-                return "scheduled"
-            return "today"
-        else:
-            # Future date
-            if date_str in self.selected_dates:
-                return "scheduled"
-            return "future"
-
-    def _get_status_color(self, status: str) -> str:
-        """Get background color for a date status"""
-        color_map = {
-            "captured": self.COLORS["captured"],
-            "scheduled": self.COLORS["scheduled"],
-            "past": self.COLORS["past"],
-            "today": self.COLORS["today_bg"],
-            "future": self.COLORS["future"],
-        }
-        return color_map.get(status, self.COLORS["future"])
+        captured = set()
+        mtimes = {}
+        previous = self._captured_cache_mtime
+
+        try:
+            with os.scandir(self.snapshots_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if len(name) != 8 or not name.isdigit():
+                        continue
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                    cached = previous.get(name)
+                    if cached is not None and cached[0] == mtime:
+                        has_images = cached[1]
+                    else:
+                        has_images = self._folder_has_images(entry.path)
+
+                    mtimes[name] = (mtime, has_images)
+                    if has_images:
+                        captured.add(name)
+        except OSError:
+            # Missing/unreadable snapshots folder - nothing captured on disk
+            pass
+
+        self._captured_cache = captured
+        self._captured_cache_mtime = mtimes
+        self._snapshots_mtime = gate
+
+    @staticmethod
+    def _folder_has_images(folder: str) -> bool:
+        """True if the folder holds at least one .jpg/.jpeg (stops at the first)"""
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(".jpg") or name.endswith(".jpeg"):
+                        return True
+        except OSError:
+            # Folder removed (or unreadable) since the parent was listed
+            pass
+        return False
+
+    def invalidate_captures_cache(self):
+        """Force the next redraw to rescan snapshots_dir (call after writing captures)"""
+        self._snapshots_mtime = None
 
     def _has_captures(self, check_date: date) -> bool:
         """Check if a date has captured images (via history or folder check)"""
-        date_str = check_date.strftime("%Y%m%d")
+        date_str = f"{check_date.year:04d}{check_date.month:02d}{check_date.day:02d}"
 
         # Check capture history first (persists even after snapshots deleted)
         if self.capture_history and self.capture_history.has_capture(date_str):
             return True
 
         # Fallback: check folder for legacy/untracked captures
-        date_folder = self.snapshots_dir / date_str
-        if date_folder.exists():
-            return any(date_folder.glob("*.jpg")) or any(date_folder.glob("*.jpeg"))
-
-        return False
+        return date_str in self._captured_cache
 
     def _on_day_click(self, month_offset: int, row: int, col: int):
         """Handle click on a day cell"""
         # Calculate which date was clicked
         month_date = self._add_months(self.view_date, month_offset)
 
-        cal = calendar.Calendar(firstweekday=6)
-        month_days = list(cal.itermonthdays(month_date.year, month_date.month))
+        month_days = _month_days(month_date.year, month_date.month)
 
-        idx = row * 7 + col
-        if idx >= len(month_days):
-            return
-
-        day = month_days[idx]
+        day = month_days[row * 7 + col]
         if day == 0:
             return
 
@@ -341,44 +451,34 @@ class TwoMonthCalendar(ttk.Frame):
         if clicked_date < today:
             return
 
-        date_str = clicked_date.strftime("%Y-%m-%d")
+        key = month_date.year * 10000 + month_date.month * 100 + day
 
         # Toggle selection
-        if date_str in self.selected_dates:
-            self.selected_dates.remove(date_str)
+        if key in self._selected_keys:
+            self._selected_keys.remove(key)
         else:
-            self.selected_dates.add(date_str)
+            self._selected_keys.add(key)
 
-        # Update display
-        self._update_display()
+        # Repaint just this cell (today or future, so no capture lookup)
+        self._paint_cell(month_offset, row, col, clicked_date, today)
 
         # Notify callback
-        if self.on_selection_change:
-            self.on_selection_change(self.selected_dates.copy())
+        self._request_notify()
 
     def _prev_month(self):
         """Navigate to previous month"""
         self.view_date = self._add_months(self.view_date, -1)
-        self._update_display()
+        self._request_redraw()
 
     def _next_month(self):
         """Navigate to next month"""
         self.view_date = self._add_months(self.view_date, 1)
-        self._update_display()
+        self._request_redraw()
 
     def _add_months(self, d: date, months: int) -> date:
-        """Add months to a date"""
-        month = d.month + months
-        year = d.year
-
-        while month > 12:
-            month -= 12
-            year += 1
-        while month < 1:
-            month += 12
-            year -= 1
-
-        return date(year, month, 1)
+        """Add months to a date (returns the first of the resulting month)"""
+        year, month = divmod(d.year * 12 + (d.month - 1) + months, 12)
+        return date(year, month + 1, 1)
 
     def _select_all(self):
         """Select all future dates in the visible months"""
@@ -386,43 +486,82 @@ class TwoMonthCalendar(ttk.Frame):
 
         for month_offset in range(2):
             month_date = self._add_months(self.view_date, month_offset)
+            y, m = month_date.year, month_date.month
+            if (y, m) < (today.year, today.month):
+                continue
 
-            # Get all days in this month
-            _, num_days = calendar.monthrange(month_date.year, month_date.month)
-
-            for day in range(1, num_days + 1):
-                d = date(month_date.year, month_date.month, day)
-                if d >= today:
-                    self.selected_dates.add(d.strftime("%Y-%m-%d"))
+            # Get all days in this month, from today onwards
+            _, num_days = calendar.monthrange(y, m)
+            start = today.day if (y, m) == (today.year, today.month) else 1
 
-        self._update_display()
+            base = y * 10000 + m * 100
+            self._selected_keys.update(range(base + start, base + num_days + 1))
 
-        if self.on_selection_change:
-            self.on_selection_change(self.selected_dates.copy())
+        self._request_redraw()
+        self._request_notify()
 
     def _clear_all(self):
         """Clear all selected dates"""
-        self.selected_dates.clear()
-        self._update_display()
-
-        if self.on_selection_change:
-            self.on_selection_change(self.selected_dates.copy())
+        self._selected_keys.clear()
+        self._request_redraw()
+        self._request_notify()
+
+    def _request_redraw(self):
+        """Redraw the calendar once the event loop is idle (coalesces bursts)"""
+        self._redraw_pending = True
+        self._schedule_idle()
+
+    def _request_notify(self):
+        """Fire on_selection_change once the event loop is idle (coalesces bursts)"""
+        self._notify_pending = True
+        self._schedule_idle()
+
+    def _schedule_idle(self):
+        """Queue a single _do_redraw pass for all pending requests"""
+        if not self._idle_scheduled:
+            self._idle_scheduled = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        """Run the pending redraw and/or selection callback"""
+        self._idle_scheduled = False
+
+        if self._redraw_pending and self.winfo_viewable():
+            self._redraw_pending = False
+            self._update_display()
+
+        if self._notify_pending:
+            self._notify_pending = False
+            if self.on_selection_change:
+                self.on_selection_change(self.get_selected_dates())
 
     # Public API
 
+    def redraw_if_shown(self):
+        """Run a redraw deferred while hidden (call when the calendar's tab is selected)"""
+        if self._redraw_pending:
+            self._schedule_idle()
+
     def get_selected_dates(self) -> Set[str]:
         """Get set of selected date strings (YYYY-MM-DD format)"""
-        return self.selected_dates.copy()
+        return {f"{k // 10000:04d}-{k // 100 % 100:02d}-{k % 100:02d}" for k in self._selected_keys}
 
     def set_selected_dates(self, dates: Set[str]):
-        """Set selected dates from a set of date strings"""
-        self.selected_dates = set(dates)
-        self._update_display()
+        """Set selected dates from a set of date strings (malformed ones are dropped)"""
+        keys = set()
+        for date_str in dates:
+            try:
+                year, month, day = date_str.split("-")
+                keys.add(int(year) * 10000 + int(month) * 100 + int(day))
+            except ValueError:
+                continue
+        self._selected_keys = keys
+        self._request_redraw()
 
     def set_snapshots_dir(self, path: str):
         """Update the snapshots directory path"""
         self.snapshots_dir = Path(path)
-        self._update_display()
+        self._request_redraw()
 
 
 def test_calendar_widget():
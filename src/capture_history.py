@@ -5,12 +5,30 @@ Stores session data in capture_history.json to persist captured dates even after
 snapshots are deleted (e.g., after auto video creation).
 """
 
+import atexit
+import os
 import sys
 import json
-from dataclasses import dataclass, asdict
+import threading
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
+
+# Optional: orjson encodes/decodes in C, several times faster than the
+# stdlib json module. The file format (indented JSON) is the same either way.
+try:
+    import orjson
+
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    def _dumps(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    _loads = json.loads
 
 
 def get_app_base_dir() -> Path:
@@ -23,9 +41,9 @@ def get_app_base_dir() -> Path:
         return Path(__file__).parent.parent
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CaptureSession:
-    """Represents a completed capture session."""
+    """Represents a completed capture session (immutable - use dataclasses.replace)."""
     date: str              # YYYYMMDD format
     start_time: str        # ISO format datetime
     end_time: str          # ISO format datetime
@@ -42,10 +60,19 @@ class CaptureSession:
         """Create from dictionary."""
         return cls(**data)
 
+    @property
+    def is_successful(self) -> bool:
+        """True if the session completed and captured images."""
+        return self.status == "completed" and self.image_count > 0
+
 
 class CaptureHistoryManager:
     """Manages persistent capture session history."""
 
+    # Changes are written this long after the first unsaved one, so a burst
+    # of updates (record + video created) costs a single file rewrite
+    SAVE_DELAY_S = 2.0
+
     def __init__(self, config_dir: Optional[Path] = None):
         """
         Initialize capture history manager.
@@ -59,40 +86,70 @@ class CaptureHistoryManager:
         self.config_dir = Path(config_dir)
         self.history_file = self.config_dir / 'capture_history.json'
         self.sessions: Dict[str, CaptureSession] = {}  # Keyed by date string
+        # Dates of successful sessions, kept in step with self.sessions so the
+        # calendar's per-day has_capture() lookups don't scan every session
+        self._completed_dates: Set[str] = set()
+
+        # Deferred saving (see _save_deferred). Sessions are recorded from
+        # worker threads as well as the GUI thread.
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
 
         self._ensure_config_dir()
         self._load()
 
+        # Don't lose a pending write when the app exits
+        atexit.register(self.flush)
+
     def _ensure_config_dir(self):
         """Ensure config directory exists."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
     def _load(self):
         """Load history from file."""
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r') as f:
-                    data = json.load(f)
-
-                sessions_list = data.get('sessions', [])
-                for session_data in sessions_list:
-                    session = CaptureSession.from_dict(session_data)
-                    self.sessions[session.date] = session
+        try:
+            data = _loads(self.history_file.read_bytes())
+            self.sessions = {s['date']: CaptureSession(**s) for s in data.get('sessions', ())}
+        except FileNotFoundError:
+            pass  # No history yet
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:  # ValueError covers JSON/UTF-8 errors
+            print(f"Warning: Could not load capture history: {e}")
+            self.sessions = {}
 
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
-                print(f"Warning: Could not load capture history: {e}")
-                self.sessions = {}
+        self._completed_dates = {d for d, s in self.sessions.items() if s.is_successful}
 
     def _save(self):
-        """Save history to file."""
-        try:
-            data = {
-                'sessions': [s.to_dict() for s in self.sessions.values()]
-            }
-            with open(self.history_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            print(f"Warning: Could not save capture history: {e}")
+        """Save history to file (written to a temp file, then renamed into place)."""
+        with self._lock:
+            self._dirty = False
+            try:
+                data = {
+                    'sessions': [s.to_dict() for s in self.sessions.values()]
+                }
+                tmp_file = self.history_file.with_suffix('.json.tmp')
+                tmp_file.write_bytes(_dumps(data))
+                os.replace(tmp_file, self.history_file)
+            except Exception as e:
+                print(f"Warning: Could not save capture history: {e}")
+
+    def _save_deferred(self):
+        """Mark history as changed and schedule a save in SAVE_DELAY_S."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY_S, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self):
+        """Write pending changes to disk now."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._save()
 
     def add_session(self, session: CaptureSession):
         """
@@ -101,8 +158,17 @@ class CaptureHistoryManager:
         Args:
             session: The capture session to record.
         """
+        with self._lock:
+            self._put(session)
+            self._save_deferred()
+
+    def _put(self, session: CaptureSession):
+        """Store a session and update the successful-dates index."""
         self.sessions[session.date] = session
-        self._save()
+        if session.is_successful:
+            self._completed_dates.add(session.date)
+        else:
+            self._completed_dates.discard(session.date)
 
     def get_session(self, date: str) -> Optional[CaptureSession]:
         """
@@ -126,10 +192,7 @@ class CaptureHistoryManager:
         Returns:
             True if capture session exists and has images.
         """
-        session = self.sessions.get(date)
-        if session:
-            return session.status == "completed" and session.image_count > 0
-        return False
+        return date in self._completed_dates
 
     def get_captured_dates(self) -> List[str]:
         """
@@ -138,10 +201,7 @@ class CaptureHistoryManager:
         Returns:
             List of date strings (YYYYMMDD format).
         """
-        return [
-            date for date, session in self.sessions.items()
-            if session.status == "completed" and session.image_count > 0
-        ]
+        return sorted(self._completed_dates)
 
     def update_video_created(self, date: str, video_created: bool = True):
         """
@@ -151,17 +211,10 @@ class CaptureHistoryManager:
             date: Date string in YYYYMMDD format.
             video_created: Whether video was created.
         """
-        if date in self.sessions:
-            session = self.sessions[date]
-            self.sessions[date] = CaptureSession(
-                date=session.date,
-                start_time=session.start_time,
-                end_time=session.end_time,
-                image_count=session.image_count,
-                video_created=video_created,
-                status=session.status
-            )
-            self._save()
+        with self._lock:
+            if date in self.sessions:
+                self._put(replace(self.sessions[date], video_created=video_created))
+                self._save_deferred()
 
     def record_session(
         self,
@@ -6,7 +6,9 @@ Centralized tooltip text for the Capture tab.
 Organized by GUI section for easy reference and maintenance.
 """
 
-CAPTURE_TOOLTIPS = {
+from types import MappingProxyType
+
+CAPTURE_TOOLTIPS = MappingProxyType({
     # ========================================
     # Camera Configuration Section
     # ========================================
@@ -162,4 +164,4 @@ CAPTURE_TOOLTIPS = {
         "Total elapsed time since the capture session started (HH:MM:SS format). "
         "Continues running until you stop the capture."
     ),
-}
+})
@@ -8,10 +8,28 @@ validation, and migration from the old config.py format.
 import sys
 import json
 import os
+import re
+import itertools
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional, Any
-from dataclasses import dataclass, asdict, field
-from typing import List
+from dataclasses import dataclass, field, fields
+from typing import List, get_origin
+
+# Optional: orjson encodes/decodes in C. The file stays indented JSON either
+# way (orjson writes non-ASCII as UTF-8 rather than \u escapes; both load).
+try:
+    import orjson
+
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    _loads = json.loads
 
 
 def get_app_base_dir() -> Path:
@@ -29,7 +47,7 @@ def get_config_path() -> Path:
     return get_app_base_dir() / "config" / "app_config.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraConfig:
     """Camera connection settings"""
     ip_address: str = "192.168.0.101"
@@ -39,7 +57,7 @@ class CameraConfig:
     force_tcp: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleConfig:
     """Capture scheduling settings"""
     start_time: str = "20:00"  # HH:MM format
@@ -47,7 +65,7 @@ class ScheduleConfig:
     folder_rollover_hour: int = 12  # 0-23
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptureConfig:
     """Capture behavior settings"""
     interval_seconds: int = 30  # Optimal for timestamp accuracy (Configuration A)
@@ -56,15 +74,16 @@ class CaptureConfig:
     buffer_frames: int = 1  # Minimal buffer for multi-threaded bufferless capture
     max_retries: int = 3  # Quick failure detection - if it fails 3 times, there's a real issue
     proactive_reconnect_seconds: int = 300  # 5 minutes - optimal for Annke cameras (Configuration A)
-    flush_buffer_count: int = 0  # Not needed with multi-threaded bufferless capture (v2.3.0+)
+    flush_buffer_count: int = 0  # Ignored - the bufferless reader always delivers the newest frame
+    backend: str = "opencv"  # opencv (cv2.VideoCapture), ffmpeg (raw ffmpeg subprocess pipe) or gstreamer
 
 
-@dataclass
+@dataclass(slots=True)
 class UIConfig:
     """UI preferences"""
     window_width: int = 1000
     window_height: int = 700
-    preview_size: str = "medium"  # small/medium/large
+    preview_size: str = "medium"  # small/medium/large - preview frame width 640/960/1280 px
     preview_enabled: bool = True
     minimize_to_tray: bool = False
     auto_start: bool = False
@@ -72,6 +91,14 @@ class UIConfig:
     last_video_preset: str = "Standard 24fps"  # Last selected video export preset
 
 
+# Sentinel for "attribute not set" lookups (getattr default)
+_MISSING = object()
+
+# Source of AstroScheduleConfig.version numbers. Shared across instances so a
+# replacement config (e.g. from from_dict) never repeats an earlier version.
+_astro_schedule_versions = itertools.count(1)
+
+
 @dataclass
 class AstroScheduleConfig:
     """Astronomical scheduling settings for long-term capture planning"""
@@ -95,8 +122,20 @@ class AstroScheduleConfig:
     manual_end_time: str = "08:00"  # HH:MM format - capture end time
     scheduler_enabled: bool = False  # Persist "Enable automatic scheduling" toggle state
 
+    def __setattr__(self, name, value):
+        # Assigning a field a different value bumps ``version`` (not a
+        # dataclass field, so it is never serialized). AstroScheduler compares
+        # it to skip recomputing cached state when nothing changed; re-assigning
+        # an equal value (e.g. a UI save of untouched settings) keeps it.
+        # In-place edits of scheduled_dates are not tracked; assign a new list
+        # instead.
+        changed = getattr(self, name, _MISSING) != value
+        object.__setattr__(self, name, value)
+        if changed:
+            object.__setattr__(self, "version", next(_astro_schedule_versions))
 
-@dataclass
+
+@dataclass(slots=True)
 class RemoteApiConfig:
     """Localhost HTTP API for external control (e.g. NINA). See issue #12.
 
@@ -108,6 +147,100 @@ class RemoteApiConfig:
     port: int = 8787  # TCP port (bound to 127.0.0.1 only)
 
 
+# HH:MM (hour/minute may be a single digit, as the capture engine accepts)
+_TIME_FULLMATCH = re.compile(r"(?:[01]?\d|2[0-3]):[0-5]?\d").fullmatch
+
+# Field names per section class, in declaration order. Used instead of
+# asdict()/__dict__ to convert sections to and from plain dicts.
+_SECTION_FIELDS = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (CameraConfig, ScheduleConfig, CaptureConfig, UIConfig,
+                AstroScheduleConfig, RemoteApiConfig)
+}
+
+
+def _copy_value(value):
+    """Copy list values so callers never share a list with their source."""
+    return list(value) if isinstance(value, list) else value
+
+
+def _section_dict(section) -> dict:
+    """
+    Shallow dict of a section's fields (lists copied).
+
+    Every field is a str/int/float/bool or a list of str, so this matches
+    asdict() without its recursive deep copy. It also leaves out non-field
+    attributes such as AstroScheduleConfig.version.
+    """
+    return {name: _copy_value(getattr(section, name)) for name in _SECTION_FIELDS[type(section)]}
+
+
+def _build_section(cls, data: dict):
+    """
+    Create a section config from a dict.
+
+    Keys the section doesn't know (settings from a newer version, removed
+    ones, or typos) are dropped instead of failing the whole load - see
+    from_dict(), which reports them; missing keys keep their defaults.
+    """
+    # Lists are copied: data may be a cached parse result (see load_from_file)
+    return cls(**{k: _copy_value(data[k]) for k in _SECTION_FIELDS[cls] if k in data})
+
+
+def _unknown_keys(section_name: str, cls, data: dict) -> list[str]:
+    """"section.key" names in data that cls has no field for."""
+    known = _SECTION_FIELDS[cls]
+    return [f"{section_name}.{k}" for k in data if k not in known]
+
+
+# validate() rules: (getter, low, high, message) for numeric ranges...
+_RANGE_RULES = tuple((path, attrgetter(path), lo, hi, message) for path, lo, hi, message in (
+    ("schedule.folder_rollover_hour", 0, 23, "Folder rollover hour must be {lo}-{hi}, got {value}"),
+    ("capture.interval_seconds", 1, 3600, "Interval must be {lo}-{hi} seconds, got {value}"),
+    ("capture.jpeg_quality", 1, 100, "JPEG quality must be {lo}-{hi}, got {value}"),
+    ("capture.buffer_frames", 1, 100, "Buffer frames must be {lo}-{hi}, got {value}"),
+    ("capture.max_retries", 1, 20, "Max retries must be {lo}-{hi}, got {value}"),
+    ("capture.proactive_reconnect_seconds", 0, 3600, "Proactive reconnect must be {lo}-{hi} seconds, got {value}"),
+    ("capture.flush_buffer_count", 0, 50, "Flush buffer count must be {lo}-{hi}, got {value}"),
+    ("astro_schedule.latitude", -90, 90, "Latitude must be {lo} to {hi}, got {value}"),
+    ("astro_schedule.longitude", -180, 180, "Longitude must be {lo} to {hi}, got {value}"),
+    ("astro_schedule.start_offset_minutes", -120, 120, "Start offset must be {lo} to {hi} minutes, got {value}"),
+    ("astro_schedule.end_offset_minutes", -120, 120, "End offset must be {lo} to {hi} minutes, got {value}"),
+    ("astro_schedule.discord_max_video_size_mb", 1, 1024,
+     "Discord max upload size must be between {lo} and {hi} MB, got {value}"),
+))
+
+# ...and (getter, allowed values, message) for string choices
+_CHOICE_RULES = tuple((path, attrgetter(path), choices, message) for path, choices, message in (
+    ("capture.backend", ("opencv", "ffmpeg", "gstreamer"), "Capture backend must be {choices}, got {value}"),
+    ("ui.preview_size", ("small", "medium", "large"), "Preview size must be {choices}, got {value}"),
+    ("astro_schedule.twilight_type", ("civil", "nautical", "astronomical"),
+     "Twilight type must be {choices}, got {value}"),
+    ("astro_schedule.discord_export_resolution", ("original", "720p", "480p", "360p"),
+     "Discord export resolution must be {choices}, got {value}"),
+))
+
+# Old config.py module attribute -> (section, field) in the new config
+_OLD_CONFIG_FIELDS = (
+    ("rtsp_ip_address", "camera", "ip_address"),
+    ("rtsp_username", "camera", "username"),
+    ("rtsp_password", "camera", "password"),
+    ("rtsp_force_tcp", "camera", "force_tcp"),
+    ("capture_start_time", "schedule", "start_time"),
+    ("capture_end_time", "schedule", "end_time"),
+    ("folder_rollover_hour", "schedule", "folder_rollover_hour"),
+    ("snapshot_interval_seconds", "capture", "interval_seconds"),
+    ("jpeg_quality", "capture", "jpeg_quality"),
+    ("rtsp_buffer_frames", "capture", "buffer_frames"),
+    ("rtsp_max_retries", "capture", "max_retries"),
+)
+
+
+# Parsed config files by absolute path: ((st_mtime_ns, st_size), dict).
+# Lets a reload of an unchanged file skip reading and parsing it.
+_parse_cache: dict = {}
+
+
 class ConfigManager:
     """
     Manages application configuration.
@@ -133,30 +266,32 @@ class ConfigManager:
         Returns:
             Dictionary representation suitable for JSON serialization
         """
-        return {
-            "camera": asdict(self.camera),
-            "schedule": asdict(self.schedule),
-            "capture": asdict(self.capture),
-            "ui": asdict(self.ui),
-            "astro_schedule": asdict(self.astro_schedule),
-            "remote_api": asdict(self.remote_api)
-        }
-
-    def from_dict(self, config_dict: dict):
+        return {name: _section_dict(section) for name, section in self._sections()}
+
+    def from_dict(self, config_dict: dict) -> list[str]:
         """
         Load configuration from dictionary.
 
         Args:
             config_dict: Dictionary with configuration sections
+
+        Returns:
+            "section.key" names of unknown settings that were ignored
         """
+        ignored = []
+
+        def build(section_name, cls, data):
+            ignored.extend(_unknown_keys(section_name, cls, data))
+            return _build_section(cls, data)
+
         if "camera" in config_dict:
-            self.camera = CameraConfig(**config_dict["camera"])
+            self.camera = build("camera", CameraConfig, config_dict["camera"])
 
         if "schedule" in config_dict:
-            self.schedule = ScheduleConfig(**config_dict["schedule"])
+            self.schedule = build("schedule", ScheduleConfig, config_dict["schedule"])
 
         if "capture" in config_dict:
-            self.capture = CaptureConfig(**config_dict["capture"])
+            self.capture = build("capture", CaptureConfig, config_dict["capture"])
 
         if "ui" in config_dict:
             ui_data = dict(config_dict["ui"])
@@ -164,13 +299,15 @@ class ConfigManager:
             # "minimize_to_tray" (it now also governs the minimize button).
             if "minimize_to_tray_on_startup" in ui_data:
                 ui_data.setdefault("minimize_to_tray", ui_data.pop("minimize_to_tray_on_startup"))
-            self.ui = UIConfig(**ui_data)
+            self.ui = build("ui", UIConfig, ui_data)
 
         if "astro_schedule" in config_dict:
-            self.astro_schedule = AstroScheduleConfig(**config_dict["astro_schedule"])
+            self.astro_schedule = build("astro_schedule", AstroScheduleConfig, config_dict["astro_schedule"])
 
         if "remote_api" in config_dict:
-            self.remote_api = RemoteApiConfig(**config_dict["remote_api"])
+            self.remote_api = build("remote_api", RemoteApiConfig, config_dict["remote_api"])
+
+        return ignored
 
     def save_to_file(self, filepath: Optional[str] = None) -> tuple[bool, str]:
         """
@@ -188,13 +325,29 @@ class ConfigManager:
             config_path.parent.mkdir(parents=True, exist_ok=True)
             filepath = str(config_path)
 
+        # Write a temp file and rename it over the config, so a crash or full
+        # disk mid-save can't leave a truncated app_config.json behind
+        tmp_path = filepath + ".tmp"
         try:
-            with open(filepath, 'w') as f:
-                json.dump(self.to_dict(), f, indent=2)
+            data = _dumps(self.to_dict())
+
+            # Coarse mtimes (FAT/exFAT) could hide our own rewrite from the cache
+            _parse_cache.pop(os.path.abspath(filepath), None)
+            # Buffered, so a short write by the OS is retried until all of
+            # data is written; flush before fsync so it is all on disk
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
 
             return True, f"Configuration saved to {filepath}"
 
         except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             return False, f"Failed to save configuration: {str(e)}"
 
     def load_from_file(self, filepath: Optional[str] = None) -> tuple[bool, str]:
@@ -210,14 +363,35 @@ class ConfigManager:
         if filepath is None:
             filepath = str(get_config_path())
 
-        if not os.path.exists(filepath):
+        result = self._load_existing(filepath)
+        if result is None:
             return False, f"Configuration file not found: {filepath}"
+        return result
 
+    def _load_existing(self, filepath: str) -> Optional[tuple[bool, str]]:
+        """Like load_from_file(), but returns None if the file does not exist."""
         try:
-            with open(filepath, 'r') as f:
-                config_dict = json.load(f)
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            return False, f"Failed to load configuration: {str(e)}"
 
-            self.from_dict(config_dict)
+        try:
+            cache_path = os.path.abspath(filepath)
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _parse_cache.get(cache_path)
+            if cached is not None and cached[0] == stamp:
+                config_dict = cached[1]
+            else:
+                with open(filepath, 'rb') as f:
+                    config_dict = _loads(f.read())
+                _parse_cache[cache_path] = (stamp, config_dict)
+
+            ignored = self.from_dict(config_dict)
+            if ignored:
+                return True, (f"Configuration loaded from {filepath} "
+                              f"(ignored unknown settings: {', '.join(ignored)})")
             return True, f"Configuration loaded from {filepath}"
 
         except json.JSONDecodeError as e:
@@ -235,33 +409,10 @@ class ConfigManager:
         try:
             import config
 
-            # Migrate camera settings
-            if hasattr(config, 'rtsp_ip_address'):
-                self.camera.ip_address = config.rtsp_ip_address
-            if hasattr(config, 'rtsp_username'):
-                self.camera.username = config.rtsp_username
-            if hasattr(config, 'rtsp_password'):
-                self.camera.password = config.rtsp_password
-
-            # Migrate schedule settings
-            if hasattr(config, 'capture_start_time'):
-                self.schedule.start_time = config.capture_start_time
-            if hasattr(config, 'capture_end_time'):
-                self.schedule.end_time = config.capture_end_time
-            if hasattr(config, 'folder_rollover_hour'):
-                self.schedule.folder_rollover_hour = config.folder_rollover_hour
-
-            # Migrate capture settings
-            if hasattr(config, 'snapshot_interval_seconds'):
-                self.capture.interval_seconds = config.snapshot_interval_seconds
-            if hasattr(config, 'jpeg_quality'):
-                self.capture.jpeg_quality = config.jpeg_quality
-            if hasattr(config, 'rtsp_buffer_frames'):
-                self.capture.buffer_frames = config.rtsp_buffer_frames
-            if hasattr(config, 'rtsp_max_retries'):
-                self.capture.max_retries = config.rtsp_max_retries
-            if hasattr(config, 'rtsp_force_tcp'):
-                self.camera.force_tcp = config.rtsp_force_tcp
+            for old_name, section, field_name in _OLD_CONFIG_FIELDS:
+                value = getattr(config, old_name, _MISSING)
+                if value is not _MISSING:
+                    setattr(getattr(self, section), field_name, value)
 
             return True, "Successfully imported settings from config.py"
 
@@ -277,68 +428,78 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid: bool, errors: list[str])
         """
-        errors = []
+        # A hand-edited file can hold e.g. "30" for an int - report that, and
+        # skip the range/choice checks for just those settings
+        type_errors = self._type_errors()
+        errors = list(type_errors.values())
 
-        # Validate camera
+        # Validate required fields and formats
         if not self.camera.ip_address:
             errors.append("Camera IP address is required")
         if not self.camera.username:
             errors.append("Camera username is required")
-
-        # Validate schedule
         if not self._is_valid_time(self.schedule.start_time):
             errors.append(f"Invalid start time format: {self.schedule.start_time} (use HH:MM)")
         if not self._is_valid_time(self.schedule.end_time):
             errors.append(f"Invalid end time format: {self.schedule.end_time} (use HH:MM)")
-        if not 0 <= self.schedule.folder_rollover_hour <= 23:
-            errors.append(f"Folder rollover hour must be 0-23, got {self.schedule.folder_rollover_hour}")
-
-        # Validate capture
-        if not 1 <= self.capture.interval_seconds <= 3600:
-            errors.append(f"Interval must be 1-3600 seconds, got {self.capture.interval_seconds}")
-        if not 1 <= self.capture.jpeg_quality <= 100:
-            errors.append(f"JPEG quality must be 1-100, got {self.capture.jpeg_quality}")
         if not self.capture.output_folder:
             errors.append("Output folder is required")
-        if not 1 <= self.capture.buffer_frames <= 100:
-            errors.append(f"Buffer frames must be 1-100, got {self.capture.buffer_frames}")
-        if not 1 <= self.capture.max_retries <= 20:
-            errors.append(f"Max retries must be 1-20, got {self.capture.max_retries}")
-        if not 0 <= self.capture.proactive_reconnect_seconds <= 3600:
-            errors.append(f"Proactive reconnect must be 0-3600 seconds, got {self.capture.proactive_reconnect_seconds}")
-        if not 0 <= self.capture.flush_buffer_count <= 50:
-            errors.append(f"Flush buffer count must be 0-50, got {self.capture.flush_buffer_count}")
-
-        # Validate UI
-        if self.ui.preview_size not in ["small", "medium", "large"]:
-            errors.append(f"Preview size must be small/medium/large, got {self.ui.preview_size}")
-
-        # Validate astro_schedule
-        if not -90 <= self.astro_schedule.latitude <= 90:
-            errors.append(f"Latitude must be -90 to 90, got {self.astro_schedule.latitude}")
-        if not -180 <= self.astro_schedule.longitude <= 180:
-            errors.append(f"Longitude must be -180 to 180, got {self.astro_schedule.longitude}")
-        if self.astro_schedule.twilight_type not in ["civil", "nautical", "astronomical"]:
-            errors.append(f"Twilight type must be civil/nautical/astronomical, got {self.astro_schedule.twilight_type}")
-        if not -120 <= self.astro_schedule.start_offset_minutes <= 120:
-            errors.append(f"Start offset must be -120 to 120 minutes, got {self.astro_schedule.start_offset_minutes}")
-        if not -120 <= self.astro_schedule.end_offset_minutes <= 120:
-            errors.append(f"End offset must be -120 to 120 minutes, got {self.astro_schedule.end_offset_minutes}")
-        if not 1 <= self.astro_schedule.discord_max_video_size_mb <= 1024:
-            errors.append(
-                f"Discord max upload size must be between 1 and 1024 MB, got {self.astro_schedule.discord_max_video_size_mb}"
-            )
-        if self.astro_schedule.discord_export_resolution not in ["original", "720p", "480p", "360p"]:
-            errors.append(
-                f"Discord export resolution must be original/720p/480p/360p, got {self.astro_schedule.discord_export_resolution}"
-            )
+
+        # Validate numeric ranges and choices (messages are only formatted on failure)
+        for path, get, lo, hi, message in _RANGE_RULES:
+            if path in type_errors:
+                continue
+            value = get(self)
+            if not lo <= value <= hi:
+                errors.append(message.format(lo=lo, hi=hi, value=value))
+        for path, get, choices, message in _CHOICE_RULES:
+            if path in type_errors:
+                continue
+            value = get(self)
+            if value not in choices:
+                errors.append(message.format(choices="/".join(choices), value=value))
 
         # Validate remote API
-        if self.remote_api.enabled and not 1024 <= self.remote_api.port <= 65535:
+        if (self.remote_api.enabled and "remote_api.port" not in type_errors
+                and not 1024 <= self.remote_api.port <= 65535):
             errors.append(f"Remote API port must be 1024-65535, got {self.remote_api.port}")
 
         return len(errors) == 0, errors
 
+    def _sections(self) -> tuple:
+        """(name, section config) pairs, in to_dict() order."""
+        return (
+            ("camera", self.camera),
+            ("schedule", self.schedule),
+            ("capture", self.capture),
+            ("ui", self.ui),
+            ("astro_schedule", self.astro_schedule),
+            ("remote_api", self.remote_api),
+        )
+
+    def _type_errors(self) -> dict[str, str]:
+        """
+        Check every setting against its declared field type.
+
+        Returns:
+            Dict of "section.field" -> error message (empty if all types match)
+        """
+        errors = {}
+        for section_name, section in self._sections():
+            for f in fields(section):
+                value = getattr(section, f.name)
+                expected = get_origin(f.type) or f.type  # List[str] -> list
+                if expected is float:
+                    ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+                elif expected is int:
+                    ok = isinstance(value, int) and not isinstance(value, bool)
+                else:
+                    ok = isinstance(value, expected)
+                if not ok:
+                    path = f"{section_name}.{f.name}"
+                    errors[path] = f"{path} must be {expected.__name__}, got {type(value).__name__} {value!r}"
+        return errors
+
     def _is_valid_time(self, time_str: str) -> bool:
         """
         Check if time string is valid HH:MM format.
@@ -349,16 +510,7 @@ class ConfigManager:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            parts = time_str.split(":")
-            if len(parts) != 2:
-                return False
-
-            hour, minute = int(parts[0]), int(parts[1])
-            return 0 <= hour <= 23 and 0 <= minute <= 59
-
-        except (ValueError, AttributeError):
-            return False
+        return isinstance(time_str, str) and _TIME_FULLMATCH(time_str) is not None
 
     def get_summary(self) -> str:
         """
@@ -367,50 +519,52 @@ class ConfigManager:
         Returns:
             Multi-line string with configuration summary
         """
-        lines = [
-            "=== Configuration Summary ===",
-            "",
-            "Camera:",
-            f"  IP Address: {self.camera.ip_address}",
-            f"  Username: {self.camera.username}",
-            f"  Password: {'*' * len(self.camera.password)}",
-            f"  Force TCP: {self.camera.force_tcp}",
-            "",
-            "Schedule:",
-            f"  Start Time: {self.schedule.start_time}",
-            f"  End Time: {self.schedule.end_time}",
-            f"  Folder Rollover: {self.schedule.folder_rollover_hour}:00",
-            "",
-            "Capture:",
-            f"  Interval: {self.capture.interval_seconds} seconds",
-            f"  JPEG Quality: {self.capture.jpeg_quality}",
-            f"  Output Folder: {self.capture.output_folder}",
-            f"  Buffer Frames: {self.capture.buffer_frames}",
-            f"  Max Retries: {self.capture.max_retries}",
-            f"  Proactive Reconnect: {self.capture.proactive_reconnect_seconds}s ({'enabled' if self.capture.proactive_reconnect_seconds > 0 else 'disabled'})",
-            "",
-            "UI:",
-            f"  Window Size: {self.ui.window_width}x{self.ui.window_height}",
-            f"  Preview: {self.ui.preview_size} ({'enabled' if self.ui.preview_enabled else 'disabled'})",
-            f"  Minimize to Tray: {self.ui.minimize_to_tray}",
-            f"  Auto-start: {self.ui.auto_start}",
-            "",
-            "Astro Schedule:",
-            f"  Time Mode: {'Manual' if self.astro_schedule.use_manual_times else 'Twilight-based'}",
-            f"  Location: {self.astro_schedule.latitude}, {self.astro_schedule.longitude}",
-            f"  Twilight Type: {self.astro_schedule.twilight_type}",
-            f"  Start Offset: {self.astro_schedule.start_offset_minutes} min",
-            f"  End Offset: {self.astro_schedule.end_offset_minutes} min",
-            f"  Manual Times: {self.astro_schedule.manual_start_time} - {self.astro_schedule.manual_end_time}",
-            f"  Scheduled Dates: {len(self.astro_schedule.scheduled_dates)} dates",
-            f"  Auto Video: {'enabled' if self.astro_schedule.auto_create_video else 'disabled'}",
-            "",
-            "Remote API:",
-            f"  Enabled: {self.remote_api.enabled}",
-            f"  Port: {self.remote_api.port}",
-        ]
-
-        return "\n".join(lines)
+        cam, sched, cap, ui, astro, api = (
+            self.camera, self.schedule, self.capture, self.ui, self.astro_schedule, self.remote_api
+        )
+        reconnect_state = 'enabled' if cap.proactive_reconnect_seconds > 0 else 'disabled'
+        return (
+            "=== Configuration Summary ===\n"
+            "\n"
+            "Camera:\n"
+            f"  IP Address: {cam.ip_address}\n"
+            f"  Username: {cam.username}\n"
+            f"  Password: {'*' * len(cam.password)}\n"
+            f"  Force TCP: {cam.force_tcp}\n"
+            "\n"
+            "Schedule:\n"
+            f"  Start Time: {sched.start_time}\n"
+            f"  End Time: {sched.end_time}\n"
+            f"  Folder Rollover: {sched.folder_rollover_hour}:00\n"
+            "\n"
+            "Capture:\n"
+            f"  Interval: {cap.interval_seconds} seconds\n"
+            f"  JPEG Quality: {cap.jpeg_quality}\n"
+            f"  Output Folder: {cap.output_folder}\n"
+            f"  Buffer Frames: {cap.buffer_frames}\n"
+            f"  Max Retries: {cap.max_retries}\n"
+            f"  Proactive Reconnect: {cap.proactive_reconnect_seconds}s ({reconnect_state})\n"
+            "\n"
+            "UI:\n"
+            f"  Window Size: {ui.window_width}x{ui.window_height}\n"
+            f"  Preview: {ui.preview_size} ({'enabled' if ui.preview_enabled else 'disabled'})\n"
+            f"  Minimize to Tray: {ui.minimize_to_tray}\n"
+            f"  Auto-start: {ui.auto_start}\n"
+            "\n"
+            "Astro Schedule:\n"
+            f"  Time Mode: {'Manual' if astro.use_manual_times else 'Twilight-based'}\n"
+            f"  Location: {astro.latitude}, {astro.longitude}\n"
+            f"  Twilight Type: {astro.twilight_type}\n"
+            f"  Start Offset: {astro.start_offset_minutes} min\n"
+            f"  End Offset: {astro.end_offset_minutes} min\n"
+            f"  Manual Times: {astro.manual_start_time} - {astro.manual_end_time}\n"
+            f"  Scheduled Dates: {len(astro.scheduled_dates)} dates\n"
+            f"  Auto Video: {'enabled' if astro.auto_create_video else 'disabled'}\n"
+            "\n"
+            "Remote API:\n"
+            f"  Enabled: {api.enabled}\n"
+            f"  Port: {api.port}"
+        )
 
     @classmethod
     def load_or_create_default(cls, filepath: Optional[str] = None) -> 'ConfigManager':
@@ -431,8 +585,10 @@ class ConfigManager:
         if filepath is None:
             filepath = cls.DEFAULT_CONFIG_FILE
 
-        if os.path.exists(filepath):
-            success, message = manager.load_from_file(filepath)
+        # A single stat in _load_existing() decides between loading and migrating
+        result = manager._load_existing(filepath)
+        if result is not None:
+            success, message = result
             if success:
                 print(f"✓ {message}")
             else:
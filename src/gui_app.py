@@ -21,6 +21,7 @@ from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 import numpy as np
 
@@ -99,6 +100,7 @@ class RTSPTimelapseGUI:
         # Configuration and engine
         self.config_manager = ConfigManager()
         self.capture_engine = None
+        self._engine_drain_job = None  # root.after id of _drain_engine_events
         self.is_capturing = False
         self.remote_server = None
         # App-owned timer for a scheduled (/capture/schedule) auto-stop.
@@ -112,6 +114,17 @@ class RTSPTimelapseGUI:
         self.preview_enabled = tk.BooleanVar(value=self.config_manager.ui.preview_enabled)
         self.current_preview_image = None
         self.preview_photo = None
+        # Plain-bool mirror of preview_enabled, readable from the capture thread
+        self._preview_on = self.preview_enabled.get()
+        # Two preview buffers used alternately: the capture thread copies the
+        # new frame into one while the other may still be on screen (it is
+        # kept as current_preview_image for redraws on resize). _preview_busy
+        # is set while a handed-off buffer waits for the Tk thread to convert
+        # it; frames arriving meanwhile get no preview, so neither buffer is
+        # overwritten while in use.
+        self._preview_buffers = [None, None]
+        self._preview_buffer_idx = 0
+        self._preview_busy = False
 
         # Statistics
         self.total_captures = 0
@@ -185,7 +198,7 @@ class RTSPTimelapseGUI:
         self.notebook.add(self.integrations_panel, text="  Integrations  ")
 
         # Bind tab change event for auto-save
-        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
 
         # Set up scheduling panel callbacks
         self.scheduling_panel.set_callbacks(
@@ -1003,7 +1016,7 @@ class RTSPTimelapseGUI:
 
         Args:
             skip_schedule_times: If True, don't update schedule times (used when
-                               astronomical scheduler has already set the times)
+                               astronomical scheduler supplies its own times)
         """
         self.config_manager.camera.ip_address = self.ip_entry.get()
         self.config_manager.camera.username = self.username_entry.get()
@@ -1096,12 +1109,14 @@ class RTSPTimelapseGUI:
         else:
             self.stop_capture()
 
-    def start_capture(self, from_scheduler: bool = False, show_dialogs: bool = True,
-                      immediate: bool = False):
+    def start_capture(self, schedule_times: Optional[Tuple[str, str]] = None,
+                      show_dialogs: bool = True, immediate: bool = False):
         """Start the capture process
 
         Args:
-            from_scheduler: If True, called from astronomical scheduler (don't override schedule times)
+            schedule_times: (start, end) HH:MM window from the astronomical scheduler.
+                Used for this session only, in place of the Capture-tab times;
+                the saved schedule is left untouched.
             show_dialogs: If False (remote API / scheduler triggers), route failures
                 to the log and return instead of popping a modal dialog that would
                 block an unattended/headless run.
@@ -1112,8 +1127,8 @@ class RTSPTimelapseGUI:
         Returns:
             (success: bool, error: str | None)
         """
-        # Update config from UI (skip schedule times if from scheduler)
-        self.update_config_from_ui(skip_schedule_times=from_scheduler)
+        # Update config from UI (skip schedule times if the scheduler supplied them)
+        self.update_config_from_ui(skip_schedule_times=schedule_times is not None)
 
         # Validate
         valid, errors = self.config_manager.validate()
@@ -1136,12 +1151,15 @@ class RTSPTimelapseGUI:
             if immediate:
                 # Remote/NINA-triggered: bypass the schedule window, run until stopped.
                 cfg["schedule"]["ignore_window"] = True
+            if schedule_times is not None:
+                cfg["schedule"]["start_time"], cfg["schedule"]["end_time"] = schedule_times
             self.capture_engine = CaptureEngine(cfg)
 
-            # Set up callbacks
-            self.capture_engine.set_status_callback(self.on_status_update)
+            # Set up callbacks. Logs and status are not delivered by callback
+            # but drained in batches on the GUI thread (_drain_engine_events).
             self.capture_engine.set_frame_callback(self.on_frame_captured)
-            self.capture_engine.set_log_callback(self.on_log_message)
+            if self._engine_drain_job is None:
+                self._drain_engine_events()
 
             # Start capture
             self.capture_engine.start_capture()
@@ -1171,6 +1189,8 @@ class RTSPTimelapseGUI:
         self._cancel_scheduled_stop()
         if self.capture_engine:
             self.capture_engine.stop_capture()
+            # Deliver anything logged during shutdown before dropping the engine
+            self._drain_engine_events(reschedule=False)
             self.capture_engine = None
 
         self.is_capturing = False
@@ -1450,13 +1470,41 @@ class RTSPTimelapseGUI:
         for widget in inputs:
             widget.configure(state=state)
 
-    def on_status_update(self, state: CaptureState, stats: dict):
-        """Callback for status updates from capture engine"""
-        # Schedule UI update on main thread
-        self.root.after(0, lambda: self.update_status_from_engine(state, stats))
+    def _drain_engine_events(self, reschedule: bool = True):
+        """Deliver queued engine logs and status on the GUI thread (every 100 ms)"""
+        if not reschedule and self._engine_drain_job is not None:
+            self.root.after_cancel(self._engine_drain_job)
+        self._engine_drain_job = None
+        engine = self.capture_engine
+        if engine is None:
+            return
+
+        for level, message in engine.drain_logs():
+            self.log_message(level, message)
+
+        status = engine.drain_status()
+        if status is not None:
+            self.update_status_from_engine(*status)
+
+        if reschedule:
+            self._engine_drain_job = self.root.after(100, self._drain_engine_events)
 
     def on_frame_captured(self, frame):
         """Callback for frame capture"""
+        # The engine recycles its frame buffer once we return, so the deferred
+        # preview update needs its own copy - but only if preview is on, and
+        # into a reused buffer rather than a fresh allocation
+        if self._preview_on and frame is not None and not self._preview_busy:
+            self._preview_busy = True
+            self._preview_buffer_idx ^= 1
+            buf = self._preview_buffers[self._preview_buffer_idx]
+            if buf is None or buf.shape != frame.shape:
+                buf = self._preview_buffers[self._preview_buffer_idx] = np.empty_like(frame)
+            np.copyto(buf, frame)
+            frame = buf
+        else:
+            frame = None
+
         # Update statistics
         self.total_captures += 1
 
@@ -1466,16 +1514,15 @@ class RTSPTimelapseGUI:
             self.update_statistics()
 
             # Update preview if enabled
-            if self.preview_enabled.get() and frame is not None:
-                self.update_preview(frame)
+            if frame is not None:
+                try:
+                    if self.preview_enabled.get():
+                        self.update_preview(frame)
+                finally:
+                    self._preview_busy = False
 
         self.root.after(0, update_ui)
 
-    def on_log_message(self, level: str, message: str):
-        """Callback for log messages from capture engine"""
-        # Schedule log update on main thread
-        self.root.after(0, lambda: self.log_message(level, message))
-
     def update_status_from_engine(self, state: CaptureState, stats: dict):
         """Update status display from engine stats"""
         # Update state
@@ -1551,7 +1598,8 @@ class RTSPTimelapseGUI:
 
     def toggle_preview(self):
         """Toggle preview on/off"""
-        if not self.preview_enabled.get():
+        self._preview_on = self.preview_enabled.get()
+        if not self._preview_on:
             # Clear preview
             self.preview_canvas.delete("preview_image")
             if self.preview_placeholder:
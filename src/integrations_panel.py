@@ -16,14 +16,9 @@ ConfigManager and persists via save_to_file(). "Start with Windows" is registry-
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-try:
-    from src.config_manager import ConfigManager
-    from src.tooltip import ToolTip
-    from src import startup_manager
-except ImportError:
-    from config_manager import ConfigManager
-    from tooltip import ToolTip
-    import startup_manager
+from config_manager import ConfigManager
+from tooltip import ToolTip
+import startup_manager
 
 
 class IntegrationsPanel(ttk.Frame):
@@ -10,30 +10,21 @@ Features:
 - Auto video creation settings
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 from typing import Optional, Set
 from datetime import datetime
 from pathlib import Path
 
-try:
-    from src.calendar_widget import TwoMonthCalendar
-    from src.twilight_calculator import TwilightCalculator
-    from src.config_manager import ConfigManager
-    from src.preset_manager import PresetManager
-    from src.astro_scheduler import AstroScheduler
-    from src.tooltip import ToolTip
-    from src.scheduling_tooltips import SCHEDULING_TOOLTIPS
-    from src.capture_history import get_capture_history
-except ImportError:
-    from calendar_widget import TwoMonthCalendar
-    from twilight_calculator import TwilightCalculator
-    from config_manager import ConfigManager
-    from preset_manager import PresetManager
-    from astro_scheduler import AstroScheduler
-    from tooltip import ToolTip
-    from scheduling_tooltips import SCHEDULING_TOOLTIPS
-    from capture_history import get_capture_history
+from calendar_widget import TwoMonthCalendar
+from twilight_calculator import TwilightCalculator
+from config_manager import ConfigManager
+from preset_manager import PresetManager
+from astro_scheduler import AstroScheduler
+from tooltip import ToolTip
+from scheduling_tooltips import SCHEDULING_TOOLTIPS
+from capture_history import get_capture_history
 
 
 class SchedulingPanel(ttk.Frame):
@@ -69,11 +60,11 @@ class SchedulingPanel(ttk.Frame):
         # app can keep it mutually exclusive with the Remote Control API.
         self._on_toggle_callback = None
 
-        # Session tracking for capture history. Invariant: session_start_time is
-        # only ever written and read on the scheduler's monitor thread
-        # (_on_scheduler_start_capture writes; _on_session_complete /
-        # _record_capture_session read and clear), so it needs no lock. Add one
-        # if a main-thread reader is ever introduced.
+        # Session tracking for capture history. session_start_time is written
+        # on the scheduler's timer thread (_on_scheduler_start_capture) and
+        # taken and cleared on its post-processing thread (_on_session_complete),
+        # so both sides go through _session_lock.
+        self._session_lock = threading.Lock()
         self.session_start_time: Optional[datetime] = None
         self.capture_history = get_capture_history()
 
@@ -85,11 +76,21 @@ class SchedulingPanel(ttk.Frame):
         self._load_from_config()
         self._update_tonight_display()
 
+        # The calendar defers redraws while its tab isn't shown; <Map> and
+        # <Visibility> aren't reliable for a re-selected notebook tab (and
+        # Windows Tk sends no <Visibility>), so catch up on tab changes.
+        if isinstance(parent, ttk.Notebook):
+            parent.bind("<<NotebookTabChanged>>", self._on_notebook_tab_changed, add="+")
+
         # Self-healing status refresh: keep the scheduler status label in sync
         # with the scheduler's real state, so it can never get stuck (e.g. on
         # "Capturing" after a session ends). Runs on the main thread.
         self._poll_scheduler_status()
 
+    def _on_notebook_tab_changed(self, event=None):
+        """Let the calendar run any redraw it deferred while hidden."""
+        self.calendar.redraw_if_shown()
+
     def _widget_alive(self) -> bool:
         """True if this widget still exists. Used by after() callbacks that may
         fire after cleanup()/destroy, to avoid touching a torn-down widget and
@@ -106,9 +107,9 @@ class SchedulingPanel(ttk.Frame):
         if not self._widget_alive():
             return
         # This runs on the main thread and reads scheduler.capture_active (via
-        # _update_scheduler_status -> get_status), which the monitor thread
-        # writes. Unlike session_start_time, capture_active is a single boolean
-        # flag whose read is GIL-atomic in CPython, so no lock is needed here.
+        # _update_scheduler_status -> get_status), which the scheduler thread
+        # writes. capture_active is a single boolean flag whose read is
+        # GIL-atomic in CPython, so no lock is needed here.
         self._update_scheduler_status()
         # ~2s cadence is plenty for a status label and is negligible cost.
         # Store the handle so cleanup() can cancel the loop on teardown.
@@ -516,12 +517,20 @@ class SchedulingPanel(ttk.Frame):
         # Save to file
         self.config_manager.save_to_file()
 
+        # Let a running scheduler re-check against the new settings right away
+        if self.scheduler:
+            self.scheduler.notify_config_changed()
+
     def _update_twilight_calculator(self):
         """Update the twilight calculator with current location"""
         try:
             lat = float(self.latitude_var.get())
             lon = float(self.longitude_var.get())
-            self.twilight_calc = TwilightCalculator(lat, lon)
+            # Location handlers fire on every focus-out/Enter; keep the existing
+            # calculator unless the coordinates actually changed.
+            calc = self.twilight_calc
+            if calc is None or (calc.latitude, calc.longitude) != (lat, lon):
+                self.twilight_calc = TwilightCalculator(lat, lon)
         except ValueError:
             self.twilight_calc = None
 
@@ -724,7 +733,7 @@ class SchedulingPanel(ttk.Frame):
     def _update_scheduler_status(self):
         """Update the scheduler status display"""
         # Central teardown guard: this is dispatched via after(0, ...) from the
-        # monitor thread (start/stop capture) and from the periodic poll, so it
+        # scheduler timer thread (start/stop capture) and from the periodic poll, so it
         # may fire after cleanup() has destroyed the widget (see _widget_alive).
         if not self._widget_alive():
             return
@@ -746,25 +755,26 @@ class SchedulingPanel(ttk.Frame):
                 foreground="gray"
             )
 
-    def _on_scheduler_start_capture(self):
+    def _on_scheduler_start_capture(self, start_time: str, end_time: str):
         """Called by scheduler when it's time to start capture"""
-        # Called from the scheduler's monitor thread. UI work is marshalled to
-        # the main thread via after(). session_start_time is written here and
-        # read later in _record_capture_session, both on this same monitor
-        # thread (see __init__), so no locking is needed.
+        # Called from the scheduler's timer thread. UI work is marshalled to
+        # the main thread via after().
         self.after(0, self._update_scheduler_status)
-        # Track session start time for capture history
-        self.session_start_time = datetime.now()
+        # Track session start time for capture history (see __init__)
+        with self._session_lock:
+            self.session_start_time = datetime.now()
         if self.start_capture_callback:
-            # Use after() to call on main thread with from_scheduler=True
-            # This tells start_capture to use the scheduler's times, not the UI times.
+            # Use after() to call on main thread with the scheduler's window times.
+            # This tells start_capture to use them instead of the UI times.
             # show_dialogs=False: an unattended scheduler run must never block on a
             # modal error dialog (e.g. bad config) - errors go to the log instead.
-            self.after(0, lambda: self.start_capture_callback(from_scheduler=True, show_dialogs=False))
+            self.after(0, lambda: self.start_capture_callback(
+                schedule_times=(start_time, end_time), show_dialogs=False
+            ))
 
     def _on_scheduler_stop_capture(self):
         """Called by scheduler when it's time to stop capture"""
-        # Called from the scheduler's monitor thread - marshal UI work to the
+        # Called from the scheduler's timer thread - marshal UI work to the
         # main thread via after().
         # Ordering is intentional: the status refresh reflects the scheduler's
         # already-updated state (capture_active is False by now), so the label
@@ -777,19 +787,18 @@ class SchedulingPanel(ttk.Frame):
             self.after(0, self.stop_capture_callback)
 
     def _on_session_complete(self, date_str: str):
-        """Called by the scheduler on its monitor thread when a session completes."""
+        """Called by the scheduler on its post-processing thread when a session completes."""
         self._log("INFO", f"Session complete for {date_str}")
 
-        # Record to history on this (monitor) thread on purpose: it globs the
+        # Record to history on this (worker) thread on purpose: it globs the
         # snapshot directory (file I/O that could block the Tk event loop on a
         # large session), and the only Tk it touches (_log, calendar refresh) is
         # already marshalled via after() internally.
-        self._record_capture_session(date_str)
-
-        # The start time has now been consumed; clear it so a stray second
-        # on_session_complete can't silently reuse a stale value. Same monitor
-        # thread as the write/read, so no lock needed (see __init__).
-        self.session_start_time = None
+        # Take the start time and clear it in one step, so a stray second
+        # on_session_complete can't silently reuse a stale value (see __init__)
+        with self._session_lock:
+            start_time, self.session_start_time = self.session_start_time, None
+        self._record_capture_session(date_str, start_time)
 
         # auto_video_var is a tk.BooleanVar - read it (and kick off the video) on
         # the main thread.
@@ -807,7 +816,7 @@ class SchedulingPanel(ttk.Frame):
                 # Pass the date string so the callback can find the right folder
                 self.create_video_callback(date_str)
 
-    def _record_capture_session(self, date_str: str):
+    def _record_capture_session(self, date_str: str, start_time: Optional[datetime] = None):
         """Record a completed capture session to history"""
         try:
             # Count images in the snapshot folder
@@ -817,9 +826,9 @@ class SchedulingPanel(ttk.Frame):
             if date_folder.exists():
                 image_count = len(list(date_folder.glob("*.jpg"))) + len(list(date_folder.glob("*.jpeg")))
 
-            # Get session times (monitor-thread only - see __init__)
+            # Get session times
             end_time = datetime.now()
-            start_time = self.session_start_time or end_time
+            start_time = start_time or end_time
 
             # Record to history
             self.capture_history.record_session(
@@ -834,6 +843,7 @@ class SchedulingPanel(ttk.Frame):
 
             # Refresh calendar to show new captured date
             if hasattr(self, 'calendar'):
+                self.calendar.invalidate_captures_cache()
                 self.after(100, self.calendar._update_display)
 
         except Exception as e:
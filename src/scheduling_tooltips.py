@@ -3,7 +3,9 @@ Scheduling Panel Tooltips
 Provides helpful tooltip messages for the astronomical scheduling interface.
 """
 
-SCHEDULING_TOOLTIPS = {
+from types import MappingProxyType
+
+SCHEDULING_TOOLTIPS = MappingProxyType({
     # Time mode settings
     "time_mode_twilight": (
         "Use astronomical twilight calculations\n"
@@ -92,4 +94,4 @@ SCHEDULING_TOOLTIPS = {
         "Uses the preset and output folder configured in\n"
         "the Video Export tab."
     ),
-}
+})
@@ -6,7 +6,9 @@ Centralized tooltip text for the Video Export tab.
 Organized by GUI section for easy reference and maintenance.
 """
 
-VIDEO_EXPORT_TOOLTIPS = {
+from types import MappingProxyType
+
+VIDEO_EXPORT_TOOLTIPS = MappingProxyType({
     # ========================================
     # Input Selection Section
     # ========================================
@@ -138,4 +140,4 @@ VIDEO_EXPORT_TOOLTIPS = {
     "progress_details": (
         "Real-time encoding statistics from FFmpeg: frame number, encoding speed, and output size."
     ),
-}
+})
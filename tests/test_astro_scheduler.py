@@ -7,12 +7,18 @@ state instead of a stale "Capturing".
 """
 
 import sys
+import threading
+import time
 import unittest
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from unittest import mock
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import astro_scheduler  # noqa: E402
 from astro_scheduler import AstroScheduler  # noqa: E402
+from config_manager import AstroScheduleConfig  # noqa: E402
+from twilight_calculator import DarknessWindow  # noqa: E402
 
 
 class SchedulerStateOrderingTest(unittest.TestCase):
@@ -45,7 +51,7 @@ class SchedulerStateOrderingTest(unittest.TestCase):
         # "Capturing" rather than a stale "Active (waiting)".
         seen = {}
 
-        def on_start():
+        def on_start(start_time, end_time):
             seen["capture_active"] = scheduler.capture_active
 
         scheduler = AstroScheduler(
@@ -69,7 +75,7 @@ class SchedulerStateOrderingTest(unittest.TestCase):
         # code path to _start_capture_session.
         seen = {}
 
-        def on_start():
+        def on_start(start_time, end_time):
             seen["capture_active"] = scheduler.capture_active
 
         scheduler = AstroScheduler(
@@ -86,6 +92,46 @@ class SchedulerStateOrderingTest(unittest.TestCase):
         )
         self.assertTrue(scheduler.capture_active)
 
+    def test_window_times_passed_to_on_start_not_written_to_config(self):
+        started = []
+        config_manager = mock.MagicMock()
+        config_manager.schedule.start_time = "08:00"
+        scheduler = AstroScheduler(
+            config_manager=config_manager,
+            on_start_capture=lambda *times: started.append(times),
+            on_log=lambda *args: None,
+        )
+        now = datetime(2026, 5, 29, 12, 0)
+        window = DarknessWindow(
+            date=now.date(),
+            darkness_start=now.replace(hour=22, minute=15),
+            darkness_end=now.replace(hour=23, minute=45),
+            duration_hours=1.5,
+            twilight_type="astronomical",
+        )
+
+        scheduler._start_capture_session(window)
+
+        self.assertEqual(started, [("22:15", "23:45")])
+        self.assertEqual(config_manager.schedule.start_time, "08:00")
+
+    def test_status_snapshot_published_before_callbacks(self):
+        # get_status() is what the UI status refresh reads; it must already
+        # reflect the new state when the start/stop callbacks fire.
+        seen = []
+        scheduler = AstroScheduler(
+            config_manager=mock.MagicMock(),
+            on_start_capture=lambda *times: seen.append(scheduler.get_status()["capture_active"]),
+            on_stop_capture=lambda: seen.append(scheduler.get_status()["capture_active"]),
+            on_log=lambda *args: None,
+        )
+
+        scheduler._start_capture_session_manual("2026-05-29", "22:00", "05:00")
+        scheduler._stop_capture_session()
+
+        self.assertEqual(seen, [True, False])
+        self.assertIsNone(scheduler.get_status()["current_session_date"])
+
     def test_session_complete_still_fires_after_stop(self):
         completed = []
         scheduler = AstroScheduler(
@@ -98,8 +144,392 @@ class SchedulerStateOrderingTest(unittest.TestCase):
         scheduler.current_session_date = "20260529"
 
         scheduler._stop_capture_session()
+        scheduler._post_executor.shutdown(wait=True)
+
+        self.assertEqual(completed, ["20260529"])
+
+    def test_session_ending_after_scheduler_stop_is_post_processed(self):
+        # A check already running when stop() is called may still end the session
+        completed = []
+        scheduler = AstroScheduler(
+            config_manager=mock.MagicMock(),
+            on_session_complete=completed.append,
+            on_log=lambda *args: None,
+        )
+        scheduler.start()
+        scheduler.stop()
+        scheduler.capture_active = True
+        scheduler.current_session_date = "20260529"
+
+        scheduler._stop_capture_session()
+        scheduler._post_executor.shutdown(wait=True)
 
         self.assertEqual(completed, ["20260529"])
+        self.assertIsNone(scheduler.get_status()["current_session_date"])
+
+    def test_session_complete_runs_off_the_scheduler_thread(self):
+        threads = []
+        scheduler = AstroScheduler(
+            config_manager=mock.MagicMock(),
+            on_session_complete=lambda _: threads.append(threading.current_thread().name),
+            on_log=lambda *args: None,
+        )
+        scheduler.capture_active = True
+        scheduler.current_session_date = "20260529"
+
+        scheduler._stop_capture_session()
+        scheduler._post_executor.shutdown(wait=True)
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("scheduler-post"))
+
+
+class LogQueueTest(unittest.TestCase):
+    def test_logs_are_queued_until_flushed(self):
+        logged = []
+        scheduler = AstroScheduler(
+            config_manager=mock.MagicMock(),
+            on_log=lambda level, msg: logged.append((level, msg)),
+        )
+        scheduler._log("INFO", "one")
+        scheduler._log("WARNING", "two")
+        self.assertEqual(logged, [])
+
+        scheduler._flush_logs()
+
+        self.assertEqual(logged, [("INFO", "[Scheduler] one"), ("WARNING", "[Scheduler] two")])
+
+
+    def test_session_logs_are_delivered_before_callbacks(self):
+        logged = []
+        scheduler = AstroScheduler(
+            config_manager=mock.MagicMock(),
+            on_start_capture=lambda *times: logged.append("start callback"),
+            on_stop_capture=lambda: logged.append("stop callback"),
+            on_log=lambda level, msg: logged.append(msg),
+        )
+        scheduler._start_capture_session_manual("2026-05-29", "22:00", "05:00")
+        scheduler._stop_capture_session()
+
+        self.assertEqual(logged, [
+            "[Scheduler] Starting scheduled capture session for 20260529",
+            "[Scheduler] Manual window: 22:00 - 05:00",
+            "start callback",
+            "[Scheduler] Stopping scheduled capture session for 20260529",
+            "stop callback",
+        ])
+
+
+class ClockResyncTest(unittest.TestCase):
+    def test_window_is_reanchored_after_suspend(self):
+        cfg = mock.MagicMock()
+        cfg.astro_schedule = AstroScheduleConfig(latitude=51.5074, longitude=-0.1278)
+        scheduler = AstroScheduler(config_manager=cfg, on_log=lambda *args: None)
+        window = mock.MagicMock(darkness_start=datetime(2026, 1, 1, 18, 0),
+                                darkness_end=datetime(2026, 1, 2, 6, 0))
+        scheduler._get_cached_window = mock.MagicMock(return_value=window)
+
+        # Anchored an hour before darkness, at monotonic 1000s
+        before = datetime(2026, 1, 1, 17, 0)
+        wall_ns = int(before.timestamp() * 1e9)
+        scheduler._anchor_window(window, 1000 * 10**9 - wall_ns)
+
+        # Host suspended for two hours: the wall clock moved on, the monotonic one didn't
+        after = datetime(2026, 1, 1, 19, 0)
+        with mock.patch("astro_scheduler.time.monotonic_ns", return_value=1001 * 10**9), \
+                mock.patch("astro_scheduler.time.time_ns", return_value=int(after.timestamp() * 1e9)):
+            in_window, _, _ = scheduler._check_twilight_schedule(after)
+
+        self.assertTrue(in_window)
+
+
+class WindowCacheTest(unittest.TestCase):
+    def setUp(self):
+        # The window/calculator caches are module-level; start each test cold.
+        astro_scheduler._compute_window.cache_clear()
+        astro_scheduler._get_calculator.cache_clear()
+        self.addCleanup(astro_scheduler._compute_window.cache_clear)
+        self.addCleanup(astro_scheduler._get_calculator.cache_clear)
+
+    def _scheduler(self):
+        cfg = mock.MagicMock()
+        cfg.astro_schedule = AstroScheduleConfig(latitude=51.5074, longitude=-0.1278)
+        return AstroScheduler(config_manager=cfg, on_log=lambda *args: None)
+
+    def test_window_computed_once_for_unchanged_inputs(self):
+        scheduler = self._scheduler()
+        with mock.patch("astro_scheduler.TwilightCalculator") as calc_cls:
+            first = scheduler.get_tonight_window()
+            second = scheduler.get_tonight_window()
+
+        self.assertIs(first, second)
+        calc_cls.assert_called_once()
+        calc_cls.return_value.get_darkness_window.assert_called_once()
+
+    def test_window_recomputed_when_offsets_change(self):
+        scheduler = self._scheduler()
+        with mock.patch("astro_scheduler.TwilightCalculator") as calc_cls:
+            scheduler.get_tonight_window()
+            scheduler.config_manager.astro_schedule.start_offset_minutes = 15
+            scheduler.get_tonight_window()
+
+        # Same location: the calculator is reused, only the window is recomputed.
+        calc_cls.assert_called_once()
+        self.assertEqual(calc_cls.return_value.get_darkness_window.call_count, 2)
+
+    def test_unrelated_config_change_reuses_window(self):
+        scheduler = self._scheduler()
+        with mock.patch("astro_scheduler.TwilightCalculator") as calc_cls:
+            scheduler.get_tonight_window()
+            scheduler.config_manager.astro_schedule.auto_create_video = True
+            scheduler.get_tonight_window()
+
+        calc_cls.return_value.get_darkness_window.assert_called_once()
+
+    def test_schedulers_share_window_cache(self):
+        first, second = self._scheduler(), self._scheduler()
+        with mock.patch("astro_scheduler.TwilightCalculator") as calc_cls:
+            first.get_tonight_window()
+            second.get_tonight_window()
+
+        calc_cls.return_value.get_darkness_window.assert_called_once()
+
+    def test_prewarm_skips_past_dates(self):
+        scheduler = self._scheduler()
+        upcoming = date.today() + timedelta(days=3)
+        scheduler.config_manager.astro_schedule.scheduled_dates = [
+            "2000-01-01", upcoming.isoformat(), "not-a-date"
+        ]
+        with mock.patch("astro_scheduler.compute_window_for_date") as compute:
+            scheduler._prewarm_windows()
+
+        compute.assert_called_once_with(scheduler.config_manager.astro_schedule, upcoming)
+
+    def test_window_precomputed_once_per_day(self):
+        scheduler = self._scheduler()
+        scheduler.config_manager.astro_schedule.scheduled_dates = ["2000-01-01"]
+        with mock.patch.object(scheduler, "_precompute_today") as precompute:
+            scheduler._check_schedule()
+            scheduler._check_schedule()
+
+        precompute.assert_called_once()
+        self.assertEqual(scheduler._last_date, date.today())
+
+    def test_precompute_skips_unscheduled_day(self):
+        scheduler = self._scheduler()
+        cfg = scheduler.config_manager.astro_schedule
+        today = date.today().isoformat()
+        with mock.patch("astro_scheduler.compute_window_for_date") as compute:
+            scheduler._precompute_today(cfg, today, frozenset(["2000-01-01"]))
+            compute.assert_not_called()
+            scheduler._precompute_today(cfg, today, frozenset([today]))
+        compute.assert_called_once_with(cfg, date.today())
+
+    def test_config_version_bumps_on_assignment(self):
+        cfg = AstroScheduleConfig()
+        before = cfg.version
+        cfg.latitude = 10.0
+        self.assertGreater(cfg.version, before)
+        self.assertNotIn("version", AstroScheduleConfig().__dataclass_fields__)
+
+    def test_config_version_kept_when_value_unchanged(self):
+        cfg = AstroScheduleConfig(scheduled_dates=["2026-01-01"])
+        before = cfg.version
+        cfg.latitude = 0.0
+        cfg.scheduled_dates = ["2026-01-01"]
+        self.assertEqual(cfg.version, before)
+
+
+class NextEventTest(unittest.TestCase):
+    def _scheduler(self, **astro):
+        cfg = mock.MagicMock()
+        for key, value in astro.items():
+            setattr(cfg.astro_schedule, key, value)
+        return AstroScheduler(config_manager=cfg, on_log=lambda *args: None)
+
+    def test_unscheduled_day_sleeps_until_midnight(self):
+        scheduler = self._scheduler(scheduled_dates=["2000-01-01"])
+        next_event = scheduler._check_schedule()
+        self.assertEqual((next_event.hour, next_event.minute), (0, 0))
+        self.assertGreater(next_event, datetime.now())
+
+    def test_manual_mode_returns_next_boundary(self):
+        scheduler = self._scheduler(
+            scheduled_dates=[date.today().isoformat()],
+            use_manual_times=True,
+            manual_start_time="20:00",
+            manual_end_time="08:00",
+        )
+        with mock.patch.object(scheduler, "_start_capture_session_manual"), \
+                mock.patch.object(scheduler, "_stop_capture_session"):
+            next_event = scheduler._check_schedule()
+        self.assertIn((next_event.hour, next_event.minute), [(20, 0), (8, 0), (0, 0)])
+        self.assertGreater(next_event, datetime.now())
+
+    def test_notify_config_changed_rechecks_now(self):
+        scheduler = self._scheduler(scheduled_dates=["2000-01-01"])
+        scheduler._check_schedule()
+        scheduler.running = True
+        with mock.patch.object(scheduler, "_schedule_check") as schedule_check:
+            scheduler.notify_config_changed()
+        schedule_check.assert_called_once_with(0.0)
+        self.assertIsNone(scheduler._scheduled_src)
+
+    def test_sleep_is_clamped(self):
+        scheduler = self._scheduler()
+        self.assertEqual(scheduler._seconds_until(None), AstroScheduler.CHECK_INTERVAL)
+        self.assertEqual(scheduler._seconds_until(datetime.now() - timedelta(hours=1)), 1.0)
+        self.assertEqual(
+            scheduler._seconds_until(datetime.now() + timedelta(days=1)),
+            AstroScheduler.MAX_CHECK_INTERVAL,
+        )
+
+
+class TimerHubTest(unittest.TestCase):
+    def test_callbacks_run_in_deadline_order(self):
+        hub = astro_scheduler.AstroTimerHub()
+        ran = []
+        done = threading.Event()
+        hub.schedule(0.05, lambda: (ran.append("late"), done.set()))
+        hub.schedule(0.0, lambda: ran.append("early"))
+        self.assertTrue(done.wait(2))
+        self.assertEqual(ran, ["early", "late"])
+
+    def test_cancelled_timer_does_not_run(self):
+        hub = astro_scheduler.AstroTimerHub()
+        ran = []
+        done = threading.Event()
+        handle = hub.schedule(0.01, lambda: ran.append("cancelled"))
+        hub.cancel(handle)
+        hub.schedule(0.05, done.set)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(ran, [])
+        self.assertIsNone(hub.deadline(handle))
+
+    def test_stop_prevents_reregistration(self):
+        scheduler = AstroScheduler(config_manager=mock.MagicMock(), on_log=lambda *args: None)
+        scheduler.config_manager.astro_schedule.scheduled_dates = []
+        scheduler.start()
+        stop_event = scheduler.stop_event
+        scheduler.stop()
+        scheduler._run_check(stop_event)
+        self.assertIsNone(scheduler._timer)
+
+    def test_earlier_pending_check_is_kept(self):
+        scheduler = AstroScheduler(config_manager=mock.MagicMock(), on_log=lambda *args: None)
+        with mock.patch.object(astro_scheduler, "_timer_hub") as hub:
+            hub.deadline.return_value = time.monotonic_ns()
+            scheduler._schedule_check(0.0)
+            scheduler._schedule_check(60.0)
+        hub.schedule.assert_called_once()
+        hub.cancel.assert_not_called()
+
+
+class TwilightCheckTest(unittest.TestCase):
+    def _run_check(self, start_delta, end_delta):
+        now = datetime.now()
+        window = DarknessWindow(
+            date=now.date(),
+            darkness_start=now + start_delta,
+            darkness_end=now + end_delta,
+            duration_hours=(end_delta - start_delta).total_seconds() / 3600,
+            twilight_type="astronomical",
+        )
+        cfg = mock.MagicMock()
+        cfg.astro_schedule = AstroScheduleConfig(latitude=51.5, longitude=-0.1)
+        scheduler = AstroScheduler(config_manager=cfg, on_log=lambda *args: None)
+        with mock.patch("astro_scheduler.compute_window_for_date", return_value=window):
+            result = scheduler._check_twilight_schedule(now)
+        return result, window
+
+    def test_inside_window_sleeps_until_end(self):
+        (in_window, info, next_event), window = self._run_check(
+            timedelta(hours=-1), timedelta(hours=2)
+        )
+        self.assertTrue(in_window)
+        self.assertIs(info, window)
+        self.assertEqual(next_event, window.darkness_end)
+
+    def test_waits_before_window(self):
+        (in_window, _, next_event), window = self._run_check(timedelta(hours=1), timedelta(hours=8))
+        self.assertFalse(in_window)
+        self.assertEqual(next_event, window.darkness_start)
+
+
+class TransitionTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AstroScheduler(config_manager=mock.MagicMock(), on_log=lambda *args: None)
+        patcher = mock.patch.multiple(
+            self.scheduler,
+            _start_capture_session=mock.DEFAULT,
+            _start_capture_session_manual=mock.DEFAULT,
+            _stop_capture_session=mock.DEFAULT,
+        )
+        self.mocks = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_idle_in_window_starts_twilight_session(self):
+        window = mock.MagicMock()
+        self.scheduler._transition(True, window)
+        self.mocks["_start_capture_session"].assert_called_once_with(window)
+
+    def test_idle_in_window_starts_manual_session(self):
+        self.scheduler._transition(True, ("2026-05-29", "22:00", "05:00"))
+        self.mocks["_start_capture_session_manual"].assert_called_once_with(
+            "2026-05-29", "22:00", "05:00"
+        )
+
+    def test_active_out_of_window_stops(self):
+        self.scheduler.capture_active = True
+        self.scheduler._transition(False)
+        self.mocks["_stop_capture_session"].assert_called_once_with()
+
+    def test_no_edge_is_noop(self):
+        self.scheduler._transition(False)
+        self.scheduler.capture_active = True
+        self.scheduler._transition(True, mock.MagicMock())
+        for m in self.mocks.values():
+            m.assert_not_called()
+
+
+class ManualWindowTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AstroScheduler(config_manager=mock.MagicMock(), on_log=lambda *args: None)
+
+    def _within(self, hhmm, start, end):
+        hour, minute = map(int, hhmm.split(":"))
+        now = datetime(2026, 5, 29, hour, minute)
+        return self.scheduler._is_within_manual_window(now, start, end)
+
+    def test_overnight_window(self):
+        self.assertTrue(self._within("22:00", "20:00", "08:00"))
+        self.assertTrue(self._within("03:30", "20:00", "08:00"))
+        self.assertFalse(self._within("08:00", "20:00", "08:00"))
+        self.assertFalse(self._within("12:00", "20:00", "08:00"))
+
+    def test_same_day_window(self):
+        self.assertTrue(self._within("10:00", "10:00", "14:00"))
+        self.assertFalse(self._within("14:00", "10:00", "14:00"))
+        self.assertFalse(self._within("09:59", "10:00", "14:00"))
+
+    def test_empty_window(self):
+        self.assertFalse(self._within("10:00", "10:00", "10:00"))
+        self.assertFalse(self._within("00:00", "10:00", "10:00"))
+
+    def test_window_boundaries_at_midnight(self):
+        self.assertTrue(self._within("00:00", "00:00", "06:00"))
+        self.assertTrue(self._within("23:59", "20:00", "00:00"))
+        self.assertFalse(self._within("00:00", "20:00", "00:00"))
+
+    def test_invalid_time_is_outside_window(self):
+        self.assertFalse(self._within("10:00", "bogus", "14:00"))
+
+    def test_parse_is_cached_until_strings_change(self):
+        self.scheduler._parse_manual_window("20:00", "08:00")
+        cached = self.scheduler._manual_cache
+        self.scheduler._parse_manual_window("20:00", "08:00")
+        self.assertIs(self.scheduler._manual_cache, cached)
+        self.assertEqual(self.scheduler._parse_manual_window("21:00", "08:00"), (1260, 480, True))
 
 
 if __name__ == "__main__":
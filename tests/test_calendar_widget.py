@@ -0,0 +1,283 @@
+"""
+Unit tests for src/calendar_widget.py
+
+Focus: the redraw logic behind the day cells - the captured-date scan, the
+per-cell change tracking and click mapping. The methods are called on an
+instance created without __init__ (canvases mocked), so no Tk display is needed.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import calendar_widget  # noqa: E402
+from calendar_widget import TwoMonthCalendar  # noqa: E402
+
+
+def _bare_calendar(snapshots_dir):
+    """A TwoMonthCalendar with just the state the capture scan needs."""
+    cal = TwoMonthCalendar.__new__(TwoMonthCalendar)
+    cal.snapshots_dir = Path(snapshots_dir)
+    cal.capture_history = None
+    cal._captured_cache = set()
+    cal._captured_cache_mtime = {}
+    cal._snapshots_mtime = None
+    cal._selected_keys = set()
+    cal._cell_state = {}
+    cal._redraw_pending = cal._notify_pending = cal._idle_scheduled = False
+    cal.after_idle = mock.MagicMock()
+    cal.winfo_viewable = mock.MagicMock(return_value=True)
+    cal._canvases = {0: mock.MagicMock(), 1: mock.MagicMock()}
+    cal._month_headers = {0: mock.MagicMock(), 1: mock.MagicMock()}
+    cal._cell_ids = {
+        (mo, row, col): (("rect", row, col), ("text", row, col))
+        for mo in range(2) for row in range(6) for col in range(7)
+    }
+    return cal
+
+
+class CapturedCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def _make(self, name, *files):
+        folder = self.root / name
+        folder.mkdir()
+        for f in files:
+            (folder / f).write_bytes(b"")
+        return folder
+
+    def test_only_date_folders_with_images_are_captured(self):
+        self._make("20260101", "a.jpg")
+        self._make("20260102", "b.jpeg")
+        self._make("20260103", "notes.txt")
+        self._make("not-a-date", "c.jpg")
+        cal = _bare_calendar(self.root)
+
+        cal._refresh_captured_cache()
+
+        self.assertEqual(cal._captured_cache, {"20260101", "20260102"})
+        self.assertTrue(cal._has_captures(date(2026, 1, 1)))
+        self.assertFalse(cal._has_captures(date(2026, 1, 3)))
+
+    def test_changed_folder_is_rescanned(self):
+        folder = self._make("20260101")
+        cal = _bare_calendar(self.root)
+        cal._refresh_captured_cache()
+        self.assertFalse(cal._has_captures(date(2026, 1, 1)))
+
+        (folder / "a.jpg").write_bytes(b"")
+        stat = folder.stat()
+        os.utime(folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        cal.invalidate_captures_cache()
+        cal._refresh_captured_cache()
+
+        self.assertTrue(cal._has_captures(date(2026, 1, 1)))
+
+    def test_unchanged_snapshots_dir_skips_sweep(self):
+        self._make("20260101", "a.jpg")
+        cal = _bare_calendar(self.root)
+        cal._refresh_captured_cache()
+
+        with mock.patch("calendar_widget.os.scandir") as scandir:
+            cal._refresh_captured_cache()
+        scandir.assert_not_called()
+
+        # A new date folder changes the snapshots dir's mtime
+        self._make("20260102", "b.jpg")
+        stat = self.root.stat()
+        os.utime(self.root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        cal._refresh_captured_cache()
+        self.assertEqual(cal._captured_cache, {"20260101", "20260102"})
+
+    def test_folder_has_images(self):
+        self.assertTrue(TwoMonthCalendar._folder_has_images(str(self._make("a", "x.txt", "y.jpeg"))))
+        self.assertFalse(TwoMonthCalendar._folder_has_images(str(self._make("b", "x.png"))))
+        self.assertFalse(TwoMonthCalendar._folder_has_images(str(self.root / "gone")))
+
+    def test_missing_snapshots_dir(self):
+        cal = _bare_calendar(self.root / "missing")
+        cal._refresh_captured_cache()
+        self.assertEqual(cal._captured_cache, set())
+
+
+class MonthDaysTest(unittest.TestCase):
+    def test_grid_is_padded_and_sunday_first(self):
+        days = calendar_widget._month_days(2026, 2)  # Feb 1 2026 is a Sunday
+        self.assertEqual(len(days), 42)
+        self.assertEqual(days[:3], (1, 2, 3))
+        self.assertEqual(days[27:29], (28, 0))
+        self.assertIs(days, calendar_widget._month_days(2026, 2))
+
+
+class CellDiffTest(unittest.TestCase):
+    def _config_calls(self, cal):
+        return sum(c.itemconfigure.call_count for c in cal._canvases.values())
+
+    def test_unchanged_redraw_skips_tk_calls(self):
+        cal = _bare_calendar("missing")
+        month = date(2030, 1, 1)
+        cal._update_month_grid(0, month, date.today())
+        first = self._config_calls(cal)
+        self.assertEqual(first, 84)  # text + rectangle for all 42 cells
+
+        cal._update_month_grid(0, month, date.today())
+        self.assertEqual(self._config_calls(cal), first)
+
+    def test_selection_change_reconfigures_one_cell(self):
+        cal = _bare_calendar("missing")
+        month = date(2030, 1, 1)
+        cal._update_month_grid(0, month, date.today())
+        before = self._config_calls(cal)
+
+        cal._selected_keys.add(20300115)
+        cal._update_month_grid(0, month, date.today())
+
+        self.assertEqual(self._config_calls(cal) - before, 1)
+
+    def test_click_repaints_only_clicked_cell(self):
+        cal = _bare_calendar("missing")
+        cal.view_date = date(2030, 1, 1)
+        cal.on_selection_change = mock.MagicMock()
+        cal._update_month_grid(0, cal.view_date, date.today())
+        before = self._config_calls(cal)
+
+        cal._on_day_click(0, 2, 2)  # Tue 2030-01-15 (Jan 1 2030 is a Tuesday)
+
+        self.assertEqual(cal.get_selected_dates(), {"2030-01-15"})
+        self.assertEqual(self._config_calls(cal) - before, 1)
+
+        # The selection callback is deferred to the idle pass
+        cal.on_selection_change.assert_not_called()
+        cal._do_redraw()
+        cal.on_selection_change.assert_called_once_with({"2030-01-15"})
+
+
+class AddMonthsTest(unittest.TestCase):
+    def test_wraps_years_both_ways(self):
+        cal = _bare_calendar("missing")
+        self.assertEqual(cal._add_months(date(2026, 12, 15), 1), date(2027, 1, 1))
+        self.assertEqual(cal._add_months(date(2026, 1, 1), -1), date(2025, 12, 1))
+        self.assertEqual(cal._add_months(date(2026, 5, 1), -29), date(2023, 12, 1))
+        self.assertEqual(cal._add_months(date(2026, 5, 1), 0), date(2026, 5, 1))
+
+
+class CellColorTest(unittest.TestCase):
+    def _color(self, cal, current_date, today):
+        cal._paint_cell(0, 0, 0, current_date, today)
+        return cal._cell_state[(0, 0, 0)][1]
+
+    def test_colors_by_status(self):
+        colors = TwoMonthCalendar.COLORS
+        cal = _bare_calendar("missing")
+        today = date(2030, 1, 15)
+        cal._captured_cache = {"20300110"}
+        cal._selected_keys = {20300115, 20300120}
+
+        self.assertEqual(self._color(cal, date(2030, 1, 10), today), colors["captured"])
+        self.assertEqual(self._color(cal, date(2030, 1, 11), today), colors["past"])
+        self.assertEqual(self._color(cal, date(2030, 1, 15), today), colors["scheduled"])
+        self.assertEqual(self._color(cal, date(2030, 1, 20), today), colors["scheduled"])
+        self.assertEqual(self._color(cal, date(2030, 1, 21), today), colors["future"])
+        cal._selected_keys = set()
+        self.assertEqual(self._color(cal, date(2030, 1, 15), today), colors["today_bg"])
+
+
+class CanvasClickTest(unittest.TestCase):
+    def test_click_maps_to_cell(self):
+        cal = _bare_calendar("missing")
+        with mock.patch.object(cal, "_on_day_click") as on_click:
+            cal._on_canvas_click(mock.Mock(
+                widget=mock.Mock(month_offset=1),
+                x=2 * cal.CELL_W + 5, y=cal.NAME_ROW_H + 3 * cal.CELL_H + 5,
+            ))
+            # Day-name row
+            cal._on_canvas_click(mock.Mock(widget=mock.Mock(month_offset=0), x=5, y=cal.NAME_ROW_H - 5))
+        on_click.assert_called_once_with(1, 3, 2)
+
+
+class SelectAllTest(unittest.TestCase):
+    def test_selects_today_onwards_in_both_months(self):
+        cal = _bare_calendar("missing")
+        cal.on_selection_change = None
+        today = date.today()
+        cal.view_date = date(today.year, today.month, 1)
+
+        cal._select_all()
+
+        selected = cal.get_selected_dates()
+        self.assertIn(today.isoformat(), selected)
+        self.assertTrue(all(d >= today.isoformat() for d in selected))
+        next_month = cal._add_months(cal.view_date, 1)
+        self.assertIn(next_month.isoformat(), selected)
+
+    def test_past_months_select_nothing(self):
+        cal = _bare_calendar("missing")
+        cal.on_selection_change = None
+        cal.view_date = date(2000, 1, 1)
+
+        cal._select_all()
+
+        self.assertEqual(cal.get_selected_dates(), set())
+
+
+class HiddenRedrawTest(unittest.TestCase):
+    def test_redraw_deferred_until_shown(self):
+        cal = _bare_calendar("missing")
+        cal.winfo_viewable.return_value = False
+
+        with mock.patch.object(cal, "_update_display") as update:
+            cal.set_selected_dates({"2030-01-20"})
+            cal._do_redraw()
+            update.assert_not_called()
+            self.assertTrue(cal._redraw_pending)
+
+            # Tab selected again: one idle pass runs the owed redraw
+            cal.winfo_viewable.return_value = True
+            cal.after_idle.reset_mock()
+            cal.redraw_if_shown()
+            cal.after_idle.assert_called_once_with(cal._do_redraw)
+            cal._do_redraw()
+            cal.redraw_if_shown()
+
+        update.assert_called_once_with()
+        self.assertFalse(cal._redraw_pending)
+        cal.after_idle.assert_called_once_with(cal._do_redraw)
+
+
+class SelectedDatesTest(unittest.TestCase):
+    def test_round_trip_through_packed_keys(self):
+        cal = _bare_calendar("missing")
+        cal.set_selected_dates({"2026-05-29", "2030-12-01", "not-a-date"})
+        self.assertEqual(cal._selected_keys, {20260529, 20301201})
+        self.assertEqual(cal.get_selected_dates(), {"2026-05-29", "2030-12-01"})
+
+
+class CoalescedRedrawTest(unittest.TestCase):
+    def test_burst_of_updates_redraws_and_notifies_once(self):
+        cal = _bare_calendar("missing")
+        cal.view_date = date(2030, 1, 1)
+        cal.on_selection_change = mock.MagicMock()
+
+        cal._select_all()
+        cal._clear_all()
+        cal.set_selected_dates({"2030-01-20"})
+        cal.after_idle.assert_called_once_with(cal._do_redraw)
+
+        with mock.patch.object(cal, "_update_display") as update:
+            cal._do_redraw()
+
+        update.assert_called_once_with()
+        cal.on_selection_change.assert_called_once_with({"2030-01-20"})
+        self.assertFalse(cal._idle_scheduled)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -38,6 +38,26 @@ class IgnoreWindowTests(unittest.TestCase):
         eng.stop_event.set()
         self.assertTrue(eng._wait_for_start_time())
 
+    def test_schedule_times_parsed_at_construction(self):
+        eng = _engine(ignore_window=False, start="22:40", end="07:00")
+        self.assertEqual((eng._start_time.hour, eng._start_time.minute), (22, 40))
+        self.assertEqual((eng._end_time.hour, eng._end_time.minute), (7, 0))
+        self.assertTrue(eng._overnight)
+        self.assertFalse(_engine(ignore_window=False, start="08:00", end="18:00")._overnight)
+
+    def test_malformed_schedule_time_refuses_to_start(self):
+        # Construction still works (e.g. for "Test Connection")...
+        eng = _engine(ignore_window=False, start="25:00")
+        # ...but a scheduled capture fails fast without starting any thread
+        self.assertFalse(eng.start_capture())
+        self.assertIn("Invalid schedule time", eng.last_error)
+        self.assertIsNone(eng.capture_thread)
+
+    def test_malformed_schedule_time_is_irrelevant_in_remote_mode(self):
+        eng = _engine(ignore_window=True, start="7pm")
+        self.assertIsNotNone(eng._schedule_error)
+        self.assertTrue(eng._wait_for_start_time())
+
     def test_flag_absent_by_default(self):
         # A normal config has no ignore_window key, so the scheduled path applies.
         cfg = ConfigManager().to_dict()
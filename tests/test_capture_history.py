@@ -0,0 +1,108 @@
+"""
+Unit tests for src/capture_history.py
+
+Focus: the successful-dates index behind has_capture()/get_captured_dates()
+and persistence round trips. Each test uses its own temporary directory.
+"""
+
+import dataclasses
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from capture_history import CaptureHistoryManager, CaptureSession  # noqa: E402
+
+
+def _session(date, image_count=10, status="completed", video_created=False):
+    return CaptureSession(
+        date=date,
+        start_time="2026-01-01T22:00:00",
+        end_time="2026-01-02T06:00:00",
+        image_count=image_count,
+        video_created=video_created,
+        status=status,
+    )
+
+
+class CaptureHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = CaptureHistoryManager(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.history.flush()
+        self.tmp.cleanup()
+
+    def test_session_is_immutable(self):
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            _session("20260101").image_count = 5
+
+    def test_only_successful_sessions_count_as_captured(self):
+        self.history.add_session(_session("20260102"))
+        self.history.add_session(_session("20260101"))
+        self.history.add_session(_session("20260103", image_count=0, status="failed"))
+        self.history.add_session(_session("20260104", status="partial"))
+
+        self.assertTrue(self.history.has_capture("20260101"))
+        self.assertFalse(self.history.has_capture("20260103"))
+        self.assertFalse(self.history.has_capture("20260104"))
+        self.assertEqual(self.history.get_captured_dates(), ["20260101", "20260102"])
+
+    def test_replacing_a_session_updates_the_index(self):
+        self.history.add_session(_session("20260101"))
+        self.history.add_session(_session("20260101", image_count=0, status="failed"))
+        self.assertFalse(self.history.has_capture("20260101"))
+
+    def test_update_video_created_keeps_other_fields(self):
+        self.history.record_session("20260101", datetime(2026, 1, 1, 22), datetime(2026, 1, 2, 6), 42)
+        self.history.update_video_created("20260101")
+
+        session = self.history.get_session("20260101")
+        self.assertTrue(session.video_created)
+        self.assertEqual(session.image_count, 42)
+        self.assertTrue(self.history.has_capture("20260101"))
+
+    def test_history_survives_reload(self):
+        self.history.add_session(_session("20260101"))
+        self.history.add_session(_session("20260102", image_count=0, status="failed"))
+        self.history.flush()
+
+        reloaded = CaptureHistoryManager(Path(self.tmp.name))
+
+        self.assertEqual(reloaded.get_session("20260101"), _session("20260101"))
+        self.assertEqual(reloaded.get_captured_dates(), ["20260101"])
+
+    def test_corrupt_history_loads_empty(self):
+        self.history.history_file.write_bytes(b'{"sessions": [{"date": "20260101"}]}')
+        with mock.patch("builtins.print"):
+            reloaded = CaptureHistoryManager(Path(self.tmp.name))
+        self.assertEqual(reloaded.sessions, {})
+        self.assertEqual(reloaded.get_captured_dates(), [])
+
+    def test_saves_are_deferred_and_batched(self):
+        self.history.add_session(_session("20260101"))
+        self.history.update_video_created("20260101")
+        self.assertFalse(self.history.history_file.exists())
+
+        self.history.flush()
+
+        self.assertTrue(self.history.history_file.exists())
+        self.assertTrue(CaptureHistoryManager(Path(self.tmp.name)).get_session("20260101").video_created)
+        self.assertEqual(sorted(p.name for p in Path(self.tmp.name).iterdir()), ["capture_history.json"])
+
+    def test_timer_writes_pending_changes(self):
+        self.history.SAVE_DELAY_S = 0.05
+        self.history.add_session(_session("20260101"))
+        timer = self.history._save_timer
+        if timer is not None:
+            timer.join(timeout=2.0)
+        self.assertTrue(self.history.history_file.exists())
+        self.assertIsNone(self.history._save_timer)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,221 @@
+"""
+Unit tests for src/config_manager.py
+
+Focus: validation and the save/load round trip. Files are written to a
+temporary directory; the real config/app_config.json is never touched.
+"""
+
+import io
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import config_manager  # noqa: E402
+from config_manager import ConfigManager  # noqa: E402
+
+
+class ValidateTest(unittest.TestCase):
+    def test_defaults_are_valid(self):
+        self.assertEqual(ConfigManager().validate(), (True, []))
+
+    def test_wrong_type_is_reported_not_raised(self):
+        config = ConfigManager()
+        config.capture.interval_seconds = "30"
+        valid, errors = config.validate()
+        self.assertFalse(valid)
+        self.assertEqual(errors, ["capture.interval_seconds must be int, got str '30'"])
+
+    def test_type_and_range_errors_are_both_reported(self):
+        config = ConfigManager()
+        config.capture.interval_seconds = "30"
+        config.capture.jpeg_quality = 101
+        config.ui.preview_size = "huge"
+        self.assertEqual(config.validate()[1], [
+            "capture.interval_seconds must be int, got str '30'",
+            "JPEG quality must be 1-100, got 101",
+            "Preview size must be small/medium/large, got huge",
+        ])
+
+    def test_bool_is_not_accepted_as_int(self):
+        config = ConfigManager()
+        config.capture.jpeg_quality = True
+        self.assertFalse(config.validate()[0])
+
+    def test_int_is_accepted_as_float(self):
+        config = ConfigManager()
+        config.astro_schedule.latitude = 51
+        self.assertTrue(config.validate()[0])
+
+    def test_out_of_range_value(self):
+        config = ConfigManager()
+        config.capture.jpeg_quality = 101
+        self.assertEqual(config.validate(), (False, ["JPEG quality must be 1-100, got 101"]))
+
+    def test_time_format(self):
+        config = ConfigManager()
+        for good in ("00:00", "23:59", "7:05", "07:5", "20:00"):
+            self.assertTrue(config._is_valid_time(good), good)
+        for bad in ("24:00", "12:60", "1200", "12:00:00", "12:0a", "", "12:00\n", None):
+            self.assertFalse(config._is_valid_time(bad), bad)
+
+
+class FromDictTest(unittest.TestCase):
+    def test_unknown_keys_are_ignored_and_missing_keys_default(self):
+        config = ConfigManager()
+        ignored = config.from_dict({
+            "camera": {"ip_address": "10.0.0.5", "setting_from_newer_version": 1},
+            "capture": {"interval_seconds": 10, "jpeg_qualty": 80},
+        })
+        self.assertEqual(ignored, ["camera.setting_from_newer_version", "capture.jpeg_qualty"])
+        self.assertEqual(config.camera.ip_address, "10.0.0.5")
+        self.assertEqual(config.camera.username, "admin")
+        self.assertEqual(config.capture.interval_seconds, 10)
+        self.assertEqual(config.capture.jpeg_quality, 95)
+
+    def test_renamed_ui_key_is_migrated(self):
+        config = ConfigManager()
+        self.assertEqual(config.from_dict({"ui": {"minimize_to_tray_on_startup": True}}), [])
+        self.assertTrue(config.ui.minimize_to_tray)
+
+
+class MigrationTest(unittest.TestCase):
+    def test_old_config_module_is_imported(self):
+        old = types.ModuleType("config")
+        old.rtsp_ip_address = "10.0.0.5"
+        old.snapshot_interval_seconds = 15
+        old.rtsp_force_tcp = False
+        config = ConfigManager()
+        with mock.patch.dict(sys.modules, {"config": old}):
+            success, _ = config.migrate_from_old_config()
+        self.assertTrue(success)
+        self.assertEqual(config.camera.ip_address, "10.0.0.5")
+        self.assertEqual(config.capture.interval_seconds, 15)
+        self.assertFalse(config.camera.force_tcp)
+        self.assertEqual(config.camera.username, "admin")  # absent -> default kept
+
+
+class FileRoundTripTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / "app_config.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_then_load(self):
+        config = ConfigManager()
+        config.camera.ip_address = "10.0.0.5"
+        config.astro_schedule.scheduled_dates = ["2026-01-01"]
+        self.assertTrue(config.save_to_file(self.path)[0])
+
+        loaded = ConfigManager()
+        self.assertTrue(loaded.load_from_file(self.path)[0])
+        self.assertEqual(loaded.to_dict(), config.to_dict())
+
+    def test_saved_file_is_indented_json(self):
+        ConfigManager().save_to_file(self.path)
+        text = Path(self.path).read_text()
+        self.assertIn('\n  "camera": {', text)
+        self.assertEqual(json.loads(text), ConfigManager().to_dict())
+
+    def test_unchanged_file_is_parsed_once(self):
+        ConfigManager().save_to_file(self.path)
+        with mock.patch("config_manager._loads", wraps=config_manager._loads) as loads:
+            first, second = ConfigManager(), ConfigManager()
+            first.load_from_file(self.path)
+            second.load_from_file(self.path)
+        loads.assert_called_once()
+
+        # The cached parse is not shared with the loaded config
+        first.astro_schedule.scheduled_dates.append("2026-01-01")
+        self.assertEqual(second.astro_schedule.scheduled_dates, [])
+
+    def test_saving_invalidates_cached_parse(self):
+        config = ConfigManager()
+        config.save_to_file(self.path)
+        ConfigManager().load_from_file(self.path)
+
+        config.camera.ip_address = "192.168.0.102"  # same file size as before
+        config.save_to_file(self.path)
+
+        loaded = ConfigManager()
+        loaded.load_from_file(self.path)
+        self.assertEqual(loaded.camera.ip_address, "192.168.0.102")
+
+    def test_failed_save_keeps_previous_file(self):
+        ConfigManager().save_to_file(self.path)
+        before = Path(self.path).read_bytes()
+
+        config = ConfigManager()
+        config.camera.ip_address = "10.0.0.5"
+        with mock.patch("config_manager.os.fsync", side_effect=OSError("disk full")):
+            success, _ = config.save_to_file(self.path)
+
+        self.assertFalse(success)
+        self.assertEqual(Path(self.path).read_bytes(), before)
+        self.assertEqual(sorted(p.name for p in Path(self.tmp.name).iterdir()), ["app_config.json"])
+
+    def test_unknown_settings_are_named_in_load_message(self):
+        Path(self.path).write_text('{"camera": {"ip_adress": "10.0.0.5"}}')
+        success, message = ConfigManager().load_from_file(self.path)
+        self.assertTrue(success)
+        self.assertIn("ignored unknown settings: camera.ip_adress", message)
+
+    def test_short_os_writes_still_save_the_whole_file(self):
+        class ShortWriteFile(io.RawIOBase):
+            """Raw file that accepts at most 7 bytes per write()."""
+
+            def __init__(self, path):
+                self.raw = io.FileIO(path, "w")
+
+            def writable(self):
+                return True
+
+            def write(self, b):
+                return self.raw.write(bytes(b[:7]))
+
+            def fileno(self):
+                return self.raw.fileno()
+
+            def close(self):
+                self.raw.close()
+                super().close()
+
+        def short_open(path, mode="r", buffering=-1, **kwargs):
+            raw = ShortWriteFile(path)
+            return raw if buffering == 0 else io.BufferedWriter(raw)
+
+        config = ConfigManager()
+        config.camera.ip_address = "10.0.0.5"
+        with mock.patch("config_manager.open", short_open, create=True):
+            self.assertTrue(config.save_to_file(self.path)[0])
+        self.assertEqual(json.loads(Path(self.path).read_text()), config.to_dict())
+
+    def test_missing_file(self):
+        success, message = ConfigManager().load_from_file(self.path)
+        self.assertFalse(success)
+        self.assertIn("not found", message)
+
+    def test_load_or_create_default_only_migrates_missing_file(self):
+        Path(self.path).write_text("{not json")
+        with mock.patch.object(ConfigManager, "migrate_from_old_config") as migrate, \
+                mock.patch("builtins.print"):
+            config = ConfigManager.load_or_create_default(self.path)
+        migrate.assert_not_called()
+        self.assertEqual(config.to_dict(), ConfigManager().to_dict())
+
+        Path(self.path).unlink()
+        with mock.patch.object(ConfigManager, "migrate_from_old_config",
+                               return_value=(False, "no config.py")) as migrate, \
+                mock.patch("builtins.print"):
+            ConfigManager.load_or_create_default(self.path)
+        migrate.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)